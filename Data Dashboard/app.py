@@ -1,14 +1,21 @@
 import dash
 from dash import dcc, html, Input, Output, callback
-import plotly.express as px
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
-import pandas as pd
+import numpy as np
 import os
+import re
+import time
 from datetime import datetime, timedelta
+import functools
+import hmac
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from flask import request
 
 # Database utilities
-from mysql_utils import MySQLConnection, create_connection_from_env as create_mysql_connection
+from mysql_utils import MySQLConnection, DEFAULT_POOL_SIZE as MYSQL_DEFAULT_POOL_SIZE, create_connection_from_env as create_mysql_connection
 from mongodb_utils import MongoDBConnection, create_connection_from_env as create_mongodb_connection
 from neo4j_utils import Neo4jConnection, create_connection_from_env as create_neo4j_connection
 
@@ -20,80 +27,154 @@ logger = logging.getLogger(__name__)
 app = dash.Dash(__name__, title="Multi-Database Dashboard")
 app.config.suppress_callback_exceptions = True
 
+# WSGI entry point for production servers, e.g.:
+#   gunicorn app:server -w 2 -k gthread --threads 8 --timeout 60
+server = app.server
+
 # Database connections
+# Seconds that slowly changing data (university list and keywords, publication time
+# series) is cached
+QUERY_CACHE_TTL = 300
+# Shared secret for the /admin and /debug routes (sent as an X-Admin-Token header);
+# the routes refuse every request while it is unset
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN')
 mysql_conn = None
 mongodb_conn = None
 neo4j_conn = None
 
-def initialize_database_connections():
-    """Initialize connections to all databases"""
-    global mysql_conn, mongodb_conn, neo4j_conn
-    
-    # ========================================
-    # DATABASE CONNECTION SETUP
-    # ========================================
-    
-    # MySQL Connection
+# Shared layout styles (built once and reused across the layout)
+_TITLE_STYLE = {'textAlign': 'center'}
+_LABEL_STYLE = {'fontWeight': 'bold', 'marginBottom': 5}
+_INFO_STYLE = {'textAlign': 'center', 'marginTop': 10}
+_CARD_STYLE = {'width': '50%', 'display': 'inline-block', 'padding': 10}
+_CONTROLS_STYLE = {'marginBottom': 15}
+_INPUT_STYLE = {'width': '100%', 'padding': '8px', 'marginBottom': 10, 'border': '1px solid #ddd', 'borderRadius': '4px'}
+_INPUT_STYLE_LEFT = {'width': '48%', 'padding': '6px', 'marginRight': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+_INPUT_STYLE_RIGHT = {'width': '48%', 'padding': '6px', 'marginLeft': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+_BUTTON_STYLE = {'color': 'white', 'padding': '8px 16px', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer'}
+_BUTTON_STYLE_BLUE = {**_BUTTON_STYLE, 'backgroundColor': '#3498db', 'marginRight': '10px'}
+_BUTTON_STYLE_GREY = {**_BUTTON_STYLE, 'backgroundColor': '#95a5a6'}
+_BUTTON_STYLE_RED = {**_BUTTON_STYLE, 'width': '48%', 'backgroundColor': '#e74c3c', 'marginLeft': '2%'}
+_BUTTON_STYLE_PURPLE = {**_BUTTON_STYLE, 'backgroundColor': '#9b59b6'}
+_BUTTON_STYLE_GREEN = {**_BUTTON_STYLE, 'backgroundColor': '#27ae60'}
+_BUTTON_STYLE_ORANGE = {**_BUTTON_STYLE, 'backgroundColor': '#f39c12'}
+
+_SECTION_STYLE_MYSQL = {'color': '#2980b9', 'marginTop': 20}
+_SECTION_STYLE_MONGODB = {'color': '#27ae60', 'marginTop': 20}
+_SECTION_STYLE_NEO4J = {'color': '#e67e22', 'marginTop': 20}
+_RESULT_CARD_STYLE = {'padding': 10, 'margin': 5, 'borderRadius': 5}
+_FACULTY_CARD_STYLE_MYSQL = {**_RESULT_CARD_STYLE, 'backgroundColor': '#f8f9fa', 'border': '1px solid #dee2e6'}
+_FACULTY_CARD_STYLE_MONGODB = {**_RESULT_CARD_STYLE, 'backgroundColor': '#f0f8f0', 'border': '1px solid #a8e6a8'}
+_PERSON_CARD_STYLE_NEO4J = {**_RESULT_CARD_STYLE, 'backgroundColor': '#fff8e1', 'border': '1px solid #ffcc80'}
+# Publication and collaborator results are bulleted lists; keep room for the bullets
+_PUBLICATION_LIST_STYLE = {**_RESULT_CARD_STYLE, 'paddingLeft': 30, 'backgroundColor': '#e8f5e8', 'border': '1px solid #c3e6c3'}
+_COLLABORATOR_LIST_STYLE = {**_RESULT_CARD_STYLE, 'paddingLeft': 30, 'backgroundColor': '#f3e5f5', 'border': '1px solid #ce93d8'}
+_HINT_STYLE = {'color': '#7f8c8d', 'fontStyle': 'italic'}
+
+@functools.lru_cache(maxsize=32)
+def _empty_fig(text):
+    """Blank figure showing a centred message; cached per message (callers must not mutate it)"""
+    return go.Figure().add_annotation(text=text, x=0.5, y=0.5, showarrow=False)
+
+# Placeholder figures (built once at import; callbacks return them as-is)
+_PLACEHOLDER_FIG_WIDGET1 = _empty_fig("Use the keyword search above to find publications")
+_PLACEHOLDER_FIG_WIDGET2 = _empty_fig("Use the keyword comparison above to compare keywords")
+_PLACEHOLDER_FIG_WIDGET3 = _empty_fig("Use the university dropdown above to analyze keywords")
+_PLACEHOLDER_FIG_KEYWORD = _empty_fig("Enter a keyword and click 'Search Publications' to find relevant publications")
+_PLACEHOLDER_FIG_NO_KEYWORD = _empty_fig("Please enter a keyword to search")
+_PLACEHOLDER_FIG_COMPARE = _empty_fig("Enter 5 keywords and click 'Compare Keywords' to see comparison")
+_PLACEHOLDER_FIG_COMPARE_TOO_FEW = _empty_fig("Please enter at least 2 keywords to compare")
+_PLACEHOLDER_FIG_UNIVERSITY = _empty_fig("Select a university and click 'Analyze Keywords' to see top keywords")
+_PLACEHOLDER_FIG_FACULTY = _empty_fig("Enter a faculty member name and click 'Search Publications' to find their publications")
+_PLACEHOLDER_FIG_MYSQL_DOWN = _empty_fig("MySQL not connected")
+_PLACEHOLDER_FIG_SUMMARY = _empty_fig("Enter a faculty member name above to search their publications")
+
+def _init_mysql():
+    """Create and connect the MySQL connection"""
     # Set these environment variables or modify the connection parameters below:
-    # MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE, MYSQL_USER, MYSQL_PASSWORD
+    # MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE, MYSQL_USER, MYSQL_PASSWORD (and optionally
+    # MYSQL_POOL_SIZE)
     try:
-        mysql_conn = create_mysql_connection()
-        if not mysql_conn:
+        conn = create_mysql_connection()
+        if not conn:
             # Fallback to direct connection - MODIFY THESE PARAMETERS
-            mysql_conn = MySQLConnection(
+            conn = MySQLConnection(
                 host='localhost',  # CHANGE: Your MySQL host
                 port=3306,         # CHANGE: Your MySQL port
                 database='academicworld',  # CHANGE: Your MySQL database name
                 user='root',      # CHANGE: Your MySQL username
-                password='Green@7030'   # CHANGE: Your MySQL password
+                password='Green@7030',   # CHANGE: Your MySQL password
+                pool_size=MYSQL_DEFAULT_POOL_SIZE
             )
-        if mysql_conn.connect():
+        if conn.connect():
             logger.info("MySQL connection established")
         else:
             logger.error("Failed to connect to MySQL")
+        return conn
     except Exception as e:
-        logger.error(f"MySQL connection error: {e}")
-    
-    # MongoDB Connection
+        logger.error("MySQL connection error: %s", e)
+        return None
+
+def _init_mongo():
+    """Create and connect the MongoDB connection"""
     # Set these environment variables or modify the connection parameters below:
     # MONGODB_HOST, MONGODB_PORT, MONGODB_DATABASE, MONGODB_USERNAME, MONGODB_PASSWORD
     try:
-        mongodb_conn = create_mongodb_connection()
-        if not mongodb_conn:
+        conn = create_mongodb_connection()
+        if not conn:
             # Fallback to direct connection - MODIFY THESE PARAMETERS
-            mongodb_conn = MongoDBConnection(
+            conn = MongoDBConnection(
                 host='localhost',      # CHANGE: Your MongoDB host
                 port=27017,           # CHANGE: Your MongoDB port
                 database='admin',  # CHANGE: Your MongoDB database name
                 username='root',  # CHANGE: Your MongoDB username (optional)
                 password='Green7030'   # CHANGE: Your MongoDB password (optional)
             )
-        if mongodb_conn.connect():
+        if conn.connect():
             logger.info("MongoDB connection established")
         else:
             logger.error("Failed to connect to MongoDB")
+        return conn
     except Exception as e:
-        logger.error(f"MongoDB connection error: {e}")
-    
-    # Neo4j Connection
+        logger.error("MongoDB connection error: %s", e)
+        return None
+
+def _init_neo4j():
+    """Create and connect the Neo4j connection"""
     # Set these environment variables or modify the connection parameters below:
     # NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD, NEO4J_DATABASE
     try:
-        neo4j_conn = create_neo4j_connection()
-        if not neo4j_conn:
+        conn = create_neo4j_connection()
+        if not conn:
             # Fallback to direct connection - MODIFY THESE PARAMETERS
-            neo4j_conn = Neo4jConnection(
+            conn = Neo4jConnection(
                 uri='bolt://localhost:7687',  # CHANGE: Your Neo4j URI
                 username='neo4j',             # CHANGE: Your Neo4j username
                 password='Green@7030',          # CHANGE: Your Neo4j password
                 database='academicworld'              # CHANGE: Your Neo4j database name
             )
-        if neo4j_conn.connect():
+        if conn.connect():
             logger.info("Neo4j connection established")
         else:
             logger.error("Failed to connect to Neo4j")
+        return conn
     except Exception as e:
-        logger.error(f"Neo4j connection error: {e}")
+        logger.error("Neo4j connection error: %s", e)
+        return None
+
+def initialize_database_connections():
+    """Initialize connections to all databases"""
+    global mysql_conn, mongodb_conn, neo4j_conn
+    
+    # ========================================
+    # DATABASE CONNECTION SETUP
+    # ========================================
+    
+    # The three connection attempts are independent and mostly wait on the network,
+    # so run them concurrently; startup then takes as long as the slowest one.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(_init_mysql), executor.submit(_init_mongo), executor.submit(_init_neo4j)]
+        mysql_conn, mongodb_conn, neo4j_conn = [future.result() for future in futures]
 
 # Initialize connections when app starts
 initialize_database_connections()
@@ -109,8 +190,8 @@ app.layout = html.Div([
         html.H3("Database Connection Status", style={'color': '#34495e'}),
         html.Div([
             html.Span("MySQL: ", style={'fontWeight': 'bold'}),
-            html.Span("Connected" if mysql_conn and mysql_conn.connection else "Disconnected", 
-                     style={'color': 'green' if mysql_conn and mysql_conn.connection else 'red'}),
+            html.Span("Connected" if mysql_conn and mysql_conn.is_connected() else "Disconnected", 
+                     style={'color': 'green' if mysql_conn and mysql_conn.is_connected() else 'red'}),
             html.Br(),
             html.Span("MongoDB: ", style={'fontWeight': 'bold'}),
             html.Span("Connected" if mongodb_conn and mongodb_conn.client else "Disconnected",
@@ -128,35 +209,35 @@ app.layout = html.Div([
         html.Div([
             # Widget 1 - Publication Keyword Search
             html.Div([
-                html.H4("Widget 1 - Publication Keyword Search", style={'textAlign': 'center'}),
+                html.H4("Widget 1 - Publication Keyword Search", style=_TITLE_STYLE),
                 html.Div([
-                    html.Label("Enter Keyword:", style={'fontWeight': 'bold', 'marginBottom': 5}),
+                    html.Label("Enter Keyword:", style=_LABEL_STYLE),
                     dcc.Input(
                         id='keyword-input',
                         type='text',
-                        placeholder='Enter a keyword (e.g., machine learning, database, AI)...',
-                        style={'width': '100%', 'padding': '8px', 'marginBottom': 10, 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                        placeholder='Enter a keyword (e.g., machine learning, database, data mining)...',
+                        style=_INPUT_STYLE
                     ),
                     html.Button(
                         'Search Publications',
                         id='keyword-search-button',
                         n_clicks=0,
-                        style={'backgroundColor': '#3498db', 'color': 'white', 'padding': '8px 16px', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer', 'marginRight': '10px'}
+                        style=_BUTTON_STYLE_BLUE
                     ),
                     html.Button(
                         'Show All Publications',
                         id='show-all-button',
                         n_clicks=0,
-                        style={'backgroundColor': '#95a5a6', 'color': 'white', 'padding': '8px 16px', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer'}
+                        style=_BUTTON_STYLE_GREY
                     )
-                ], style={'marginBottom': 15}),
+                ], style=_CONTROLS_STYLE),
                 dcc.Graph(id='widget-1-graph'),
-                html.Div(id='widget-1-info', style={'textAlign': 'center', 'marginTop': 10})
-            ], style={'width': '50%', 'display': 'inline-block', 'padding': 10}),
+                html.Div(id='widget-1-info', style=_INFO_STYLE)
+            ], style=_CARD_STYLE),
             
             # Widget 2 - Keyword Comparison
             html.Div([
-                html.H4("Widget 2 - Keyword Comparison", style={'textAlign': 'center'}),
+                html.H4("Widget 2 - Keyword Comparison", style=_TITLE_STYLE),
                 html.Div([
                     html.Label("Enter 5 Keywords to Compare:", style={'fontWeight': 'bold', 'marginBottom': 10}),
                     html.Div([
@@ -164,27 +245,27 @@ app.layout = html.Div([
                             id='keyword-1-input',
                             type='text',
                             placeholder='Keyword 1 (e.g., machine learning)',
-                            style={'width': '48%', 'padding': '6px', 'marginRight': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                            style=_INPUT_STYLE_LEFT
                         ),
                         dcc.Input(
                             id='keyword-2-input',
                             type='text',
                             placeholder='Keyword 2 (e.g., database)',
-                            style={'width': '48%', 'padding': '6px', 'marginLeft': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                            style=_INPUT_STYLE_RIGHT
                         )
                     ], style={'marginBottom': 8}),
                     html.Div([
                         dcc.Input(
                             id='keyword-3-input',
                             type='text',
-                            placeholder='Keyword 3 (e.g., AI)',
-                            style={'width': '48%', 'padding': '6px', 'marginRight': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                            placeholder='Keyword 3 (e.g., data mining)',
+                            style=_INPUT_STYLE_LEFT
                         ),
                         dcc.Input(
                             id='keyword-4-input',
                             type='text',
                             placeholder='Keyword 4 (e.g., neural networks)',
-                            style={'width': '48%', 'padding': '6px', 'marginLeft': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                            style=_INPUT_STYLE_RIGHT
                         )
                     ], style={'marginBottom': 8}),
                     html.Div([
@@ -192,28 +273,28 @@ app.layout = html.Div([
                             id='keyword-5-input',
                             type='text',
                             placeholder='Keyword 5 (e.g., big data)',
-                            style={'width': '48%', 'padding': '6px', 'marginRight': '2%', 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                            style=_INPUT_STYLE_LEFT
                         ),
                         html.Button(
                             'Compare Keywords',
                             id='compare-keywords-button',
                             n_clicks=0,
-                            style={'width': '48%', 'backgroundColor': '#e74c3c', 'color': 'white', 'padding': '8px 16px', 'marginLeft': '2%', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer'}
+                            style=_BUTTON_STYLE_RED
                         )
                     ], style={'marginBottom': 15})
-                ], style={'marginBottom': 15}),
+                ], style=_CONTROLS_STYLE),
                 dcc.Graph(id='widget-2-graph'),
-                html.Div(id='widget-2-info', style={'textAlign': 'center', 'marginTop': 10})
-            ], style={'width': '50%', 'display': 'inline-block', 'padding': 10})
+                html.Div(id='widget-2-info', style=_INFO_STYLE)
+            ], style=_CARD_STYLE)
         ]),
         
         # Row 2
         html.Div([
             # Widget 3 - University Keyword Analysis
             html.Div([
-                html.H4("Widget 3 - University Keyword Analysis", style={'textAlign': 'center'}),
+                html.H4("Widget 3 - University Keyword Analysis", style=_TITLE_STYLE),
                 html.Div([
-                    html.Label("Select University:", style={'fontWeight': 'bold', 'marginBottom': 5}),
+                    html.Label("Select University:", style=_LABEL_STYLE),
                     dcc.Dropdown(
                         id='university-dropdown',
                         placeholder='Select a university...',
@@ -223,65 +304,65 @@ app.layout = html.Div([
                         'Analyze Keywords',
                         id='analyze-keywords-button',
                         n_clicks=0,
-                        style={'backgroundColor': '#9b59b6', 'color': 'white', 'padding': '8px 16px', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer'}
+                        style=_BUTTON_STYLE_PURPLE
                     )
-                ], style={'marginBottom': 15}),
+                ], style=_CONTROLS_STYLE),
                 dcc.Graph(id='widget-3-graph'),
-                html.Div(id='widget-3-info', style={'textAlign': 'center', 'marginTop': 10})
-            ], style={'width': '50%', 'display': 'inline-block', 'padding': 10}),
+                html.Div(id='widget-3-info', style=_INFO_STYLE)
+            ], style=_CARD_STYLE),
             
             # Widget 4 - Person Search
             html.Div([
-                html.H4("Widget 4 - Person Search", style={'textAlign': 'center'}),
+                html.H4("Widget 4 - Person Search", style=_TITLE_STYLE),
                 html.Div([
-                    html.Label("Enter Person Name:", style={'fontWeight': 'bold', 'marginBottom': 5}),
+                    html.Label("Enter Person Name:", style=_LABEL_STYLE),
                     dcc.Input(
                         id='person-name-input',
                         type='text',
                         placeholder='Enter a person\'s name...',
-                        style={'width': '100%', 'padding': '8px', 'marginBottom': 10, 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                        style=_INPUT_STYLE
                     ),
                     html.Button(
                         'Search',
                         id='search-button',
                         n_clicks=0,
-                        style={'backgroundColor': '#27ae60', 'color': 'white', 'padding': '8px 16px', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer'}
+                        style=_BUTTON_STYLE_GREEN
                     )
-                ], style={'marginBottom': 15}),
+                ], style=_CONTROLS_STYLE),
                 html.Div(id='person-search-results', style={'textAlign': 'left', 'marginTop': 10})
-            ], style={'width': '50%', 'display': 'inline-block', 'padding': 10})
+            ], style=_CARD_STYLE)
         ]),
         
         # Row 3
         html.Div([
             # Widget 5 - Time Series
             html.Div([
-                html.H4("Widget 5 - Publications Over Time", style={'textAlign': 'center'}),
+                html.H4("Widget 5 - Publications Over Time", style=_TITLE_STYLE),
                 dcc.Graph(id='widget-5-graph'),
-                html.Div(id='widget-5-info', style={'textAlign': 'center', 'marginTop': 10})
-            ], style={'width': '50%', 'display': 'inline-block', 'padding': 10}),
+                html.Div(id='widget-5-info', style=_INFO_STYLE)
+            ], style=_CARD_STYLE),
             
             # Widget 6 - Faculty Publication Search
             html.Div([
-                html.H4("Widget 6 - Faculty Publication Search", style={'textAlign': 'center'}),
+                html.H4("Widget 6 - Faculty Publication Search", style=_TITLE_STYLE),
                 html.Div([
-                    html.Label("Enter Faculty Member Name:", style={'fontWeight': 'bold', 'marginBottom': 5}),
+                    html.Label("Enter Faculty Member Name:", style=_LABEL_STYLE),
                     dcc.Input(
                         id='faculty-name-input',
                         type='text',
                         placeholder='Enter faculty member name...',
-                        style={'width': '100%', 'padding': '8px', 'marginBottom': 10, 'border': '1px solid #ddd', 'borderRadius': '4px'}
+                        style=_INPUT_STYLE
                     ),
                     html.Button(
                         'Search Publications',
                         id='faculty-search-button',
                         n_clicks=0,
-                        style={'backgroundColor': '#f39c12', 'color': 'white', 'padding': '8px 16px', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer'}
+                        style=_BUTTON_STYLE_ORANGE
                     )
-                ], style={'marginBottom': 15}),
+                ], style=_CONTROLS_STYLE),
                 dcc.Graph(id='widget-6-graph'),
-                html.Div(id='widget-6-info', style={'textAlign': 'center', 'marginTop': 10})
-            ], style={'width': '50%', 'display': 'inline-block', 'padding': 10})
+                html.Div(id='widget-6-info', style=_INFO_STYLE)
+            ], style=_CARD_STYLE)
         ])
     ]),
     
@@ -292,7 +373,10 @@ app.layout = html.Div([
     ], style={'textAlign': 'center', 'marginTop': 20}),
     
     # Hidden div for storing data
-    html.Div(id='data-store', style={'display': 'none'})
+    html.Div(id='data-store', style={'display': 'none'}),
+    
+    # Refresh click count the widgets were last rendered for
+    dcc.Store(id='last-refresh')
 ], style={'padding': 20, 'fontFamily': 'Arial, sans-serif'})
 
 # Callback to refresh all widgets
@@ -306,41 +390,43 @@ app.layout = html.Div([
      Output('widget-2-info', 'children'),
      Output('widget-3-info', 'children'),
      Output('widget-5-info', 'children'),
-     Output('widget-6-info', 'children')],
-    [Input('refresh-button', 'n_clicks')]
+     Output('widget-6-info', 'children'),
+     Output('last-refresh', 'data')],
+    [Input('refresh-button', 'n_clicks')],
+    [dash.dependencies.State('last-refresh', 'data')]
 )
-def update_widgets(n_clicks):
+def update_widgets(n_clicks, last_refresh):
     """Update all widgets with fresh data from databases"""
     
+    # Spurious re-fires for a click that was already rendered keep the current figures
+    if last_refresh is not None and n_clicks == last_refresh:
+        raise PreventUpdate
+    
+    # An explicit refresh drops cached query results so the widgets re-read the databases
+    if n_clicks:
+        clear_query_caches()
+    
     # Widget 5 - Time Series
     widget5_fig, widget5_info = get_timeseries_widget_data()
     
     # Widget 6 - Summary Stats
     widget6_fig, widget6_info = get_summary_widget_data()
     
-    # Create placeholder for Widget 1 (now handled by separate callback)
-    widget1_fig = go.Figure().add_annotation(
-        text="Use the keyword search above to find publications", 
-        x=0.5, y=0.5, showarrow=False
-    )
+    # Placeholder for Widget 1 (now handled by separate callback)
+    widget1_fig = _PLACEHOLDER_FIG_WIDGET1
     widget1_info = "Widget 1 now uses keyword search"
     
-    # Create placeholder for Widget 2 (now handled by separate callback)
-    widget2_fig = go.Figure().add_annotation(
-        text="Use the keyword comparison above to compare keywords", 
-        x=0.5, y=0.5, showarrow=False
-    )
+    # Placeholder for Widget 2 (now handled by separate callback)
+    widget2_fig = _PLACEHOLDER_FIG_WIDGET2
     widget2_info = "Widget 2 now uses keyword comparison"
     
-    # Create placeholder for Widget 3 (now handled by separate callback)
-    widget3_fig = go.Figure().add_annotation(
-        text="Use the university dropdown above to analyze keywords", 
-        x=0.5, y=0.5, showarrow=False
-    )
+    # Placeholder for Widget 3 (now handled by separate callback)
+    widget3_fig = _PLACEHOLDER_FIG_WIDGET3
     widget3_info = "Widget 3 now uses university keyword analysis"
     
     return (widget1_fig, widget2_fig, widget3_fig, widget5_fig, widget6_fig,
-            widget1_info, widget2_info, widget3_info, widget5_info, widget6_info)
+            widget1_info, widget2_info, widget3_info, widget5_info, widget6_info,
+            n_clicks)
 
 # Callback for person search
 @app.callback(
@@ -352,7 +438,7 @@ def search_person(n_clicks, person_name):
     """Search for a person across all databases"""
     if not n_clicks or not person_name:
         return html.Div("Enter a person's name and click Search to find information.", 
-                       style={'color': '#7f8c8d', 'fontStyle': 'italic'})
+                       style=_HINT_STYLE)
     
     try:
         results = get_person_information(person_name)
@@ -376,11 +462,7 @@ def search_publications_by_keyword(search_clicks, show_all_clicks, keyword):
     ctx = dash.callback_context
     if not ctx.triggered:
         # Initial load - show placeholder
-        fig = go.Figure().add_annotation(
-            text="Enter a keyword and click 'Search Publications' to find relevant publications", 
-            x=0.5, y=0.5, showarrow=False
-        )
-        return fig, "Enter a keyword to search publications"
+        return _PLACEHOLDER_FIG_KEYWORD, "Enter a keyword to search publications"
     
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
@@ -393,18 +475,12 @@ def search_publications_by_keyword(search_clicks, show_all_clicks, keyword):
             fig, info = get_all_publications()
         else:
             # No keyword provided
-            fig = go.Figure().add_annotation(
-                text="Please enter a keyword to search", 
-                x=0.5, y=0.5, showarrow=False
-            )
+            fig = _PLACEHOLDER_FIG_NO_KEYWORD
             info = "No keyword provided"
         
         return fig, info
     except Exception as e:
-        fig = go.Figure().add_annotation(
-            text=f"Error: {str(e)}", 
-            x=0.5, y=0.5, showarrow=False
-        )
+        fig = _empty_fig(f"Error: {str(e)}")
         return fig, f"Error searching publications: {str(e)}"
 
 # Callback for keyword comparison
@@ -423,27 +499,25 @@ def compare_keywords(n_clicks, keyword1, keyword2, keyword3, keyword4, keyword5)
     
     if not n_clicks:
         # Initial load - show placeholder
-        fig = go.Figure().add_annotation(
-            text="Enter 5 keywords and click 'Compare Keywords' to see comparison", 
-            x=0.5, y=0.5, showarrow=False
-        )
-        return fig, "Enter 5 keywords to compare their publication statistics"
+        return _PLACEHOLDER_FIG_COMPARE, "Enter 5 keywords to compare their publication statistics"
     
-    # Collect all non-empty keywords
-    keywords = [kw.strip() for kw in [keyword1, keyword2, keyword3, keyword4, keyword5] if kw and kw.strip()]
+    # Collect the non-empty keywords, dropping repeats (case-insensitively, as the
+    # comparison matches) so the same keyword is not queried and plotted twice
+    unique_keywords = {}
+    for kw in (keyword1, keyword2, keyword3, keyword4, keyword5):
+        kw = kw.strip() if kw else ''
+        if kw:
+            unique_keywords.setdefault(kw.lower(), kw)
+    keywords = tuple(unique_keywords.values())
     
     if len(keywords) < 2:
-        fig = go.Figure().add_annotation(
-            text="Please enter at least 2 keywords to compare", 
-            x=0.5, y=0.5, showarrow=False
-        )
-        return fig, "Please enter at least 2 keywords to compare"
+        return _PLACEHOLDER_FIG_COMPARE_TOO_FEW, "Please enter at least 2 keywords to compare"
     
     try:
         fig, info = get_keyword_comparison(keywords)
         return fig, info
     except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
+        fig = _empty_fig(f"Error: {str(e)}")
         return fig, f"Error comparing keywords: {str(e)}"
 
 # Callback to populate university dropdown
@@ -454,10 +528,9 @@ def compare_keywords(n_clicks, keyword1, keyword2, keyword3, keyword4, keyword5)
 def populate_university_dropdown(n_clicks):
     """Populate the university dropdown with available universities"""
     try:
-        universities = get_available_universities()
-        return universities
+        return list(_universities_cached(_ttl_bucket()))
     except Exception as e:
-        logger.error(f"Error populating university dropdown: {e}")
+        logger.error("Error populating university dropdown: %s", e)
         return []
 
 # Callback for university keyword analysis
@@ -472,17 +545,13 @@ def analyze_university_keywords(n_clicks, selected_university):
     
     if not n_clicks or not selected_university:
         # Initial load - show placeholder
-        fig = go.Figure().add_annotation(
-            text="Select a university and click 'Analyze Keywords' to see top keywords", 
-            x=0.5, y=0.5, showarrow=False
-        )
-        return fig, "Select a university to analyze its top research keywords"
+        return _PLACEHOLDER_FIG_UNIVERSITY, "Select a university to analyze its top research keywords"
     
     try:
         fig, info = get_university_keywords(selected_university)
         return fig, info
     except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
+        fig = _empty_fig(f"Error: {str(e)}")
         return fig, f"Error analyzing university keywords: {str(e)}"
 
 # Callback for faculty publication search
@@ -497,69 +566,265 @@ def search_faculty_publications(n_clicks, faculty_name):
     
     if not n_clicks or not faculty_name:
         # Initial load - show placeholder
-        fig = go.Figure().add_annotation(
-            text="Enter a faculty member name and click 'Search Publications' to find their publications", 
-            x=0.5, y=0.5, showarrow=False
-        )
-        return fig, "Enter a faculty member name to search their publications"
+        return _PLACEHOLDER_FIG_FACULTY, "Enter a faculty member name to search their publications"
     
     try:
         fig, info = get_faculty_publications(faculty_name)
         return fig, info
     except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
+        fig = _empty_fig(f"Error: {str(e)}")
         return fig, f"Error searching faculty publications: {str(e)}"
 
+# Full-text search over title, abstract, keywords and venue (needs the FULLTEXT index
+# from sql/indexes.sql). One round-trip returns the per-year counts aggregated by MySQL
+# ('agg' rows) followed by the 20 most cited matches ('row' rows); the wide abstract
+# column never leaves the server. Run as a prepared statement, so each pooled
+# connection parses it once and later searches only send the keyword.
+PUB_BY_KW_SQL = """
+    (SELECT 'agg' AS kind, p.year, COUNT(*) AS n, SUM(p.citations) AS citations, NULL AS venue
+     FROM publication p
+     WHERE MATCH(p.title, p.abstract, p.keywords, p.venue) AGAINST (%s IN NATURAL LANGUAGE MODE)
+     GROUP BY p.year)
+    UNION ALL
+    (SELECT 'row' AS kind, p.year, NULL AS n, p.citations, p.venue
+     FROM publication p
+     WHERE MATCH(p.title, p.abstract, p.keywords, p.venue) AGAINST (%s IN NATURAL LANGUAGE MODE)
+     ORDER BY p.citations DESC, p.year DESC
+     LIMIT 20)
+    """
+
+# Query result caches - rows are cached per argument; figures are still built per call
+@functools.lru_cache(maxsize=256)
+def _query_pubs_by_keyword(keyword):
+    """Run the keyword publication search and return the result rows"""
+    results = mysql_conn.execute_query(PUB_BY_KW_SQL, (keyword, keyword), prepared=True)
+    if results is None:
+        # Raise instead of returning so failed queries are not cached
+        raise RuntimeError("MySQL keyword search failed")
+    return tuple(results)
+
+# Column types for the all-publications rows (the query skips publications without a
+# year, which could not be plotted against year anyway)
+_ALL_PUBLICATIONS_DTYPE = np.dtype([
+    ('title', 'O'), ('year', 'i4'), ('venue', 'O'), ('citations', 'i4'), ('authors', 'O')
+])
+
+@functools.lru_cache(maxsize=1)
+def _query_all_publications():
+    """Run the all-publications query and return the result rows"""
+    # Query to get all publications with basic info
+    query = """
+    SELECT 
+        p.title,
+        p.year,
+        p.venue,
+        p.citations,
+        GROUP_CONCAT(DISTINCT f.name SEPARATOR ', ') as authors
+    FROM publication p
+    LEFT JOIN publication_author pa ON p.id = pa.publication_id
+    LEFT JOIN faculty f ON pa.faculty_id = f.id
+    WHERE p.year IS NOT NULL
+    GROUP BY p.id, p.title, p.year, p.venue, p.citations
+    ORDER BY p.citations DESC, p.year DESC
+    LIMIT 50
+    """
+    
+    results = mysql_conn.execute_query(query)
+    if results is None:
+        raise RuntimeError("MySQL publications query failed")
+    return tuple(results)
+
+@functools.lru_cache(maxsize=256)
+def _query_keyword_stats(keywords):
+    """Run one statistics query covering every keyword and return the result rows"""
+    # One aggregate branch per keyword, each with its own full-text WHERE (served by the
+    # FULLTEXT index from sql/indexes.sql), glued with UNION ALL into a single round-trip.
+    # An aggregate without GROUP BY always yields a row, so keywords without matches
+    # still appear.
+    keyword_branch = """
+    SELECT 
+        %s AS tag,
+        COUNT(*) as publication_count,
+        AVG(p.citations) as avg_citations,
+        MAX(p.citations) as max_citations,
+        MIN(p.year) as earliest_year,
+        MAX(p.year) as latest_year,
+        COUNT(DISTINCT p.venue) as unique_venues
+    FROM publication p
+    WHERE MATCH(p.title, p.abstract, p.keywords, p.venue) AGAINST (%s IN BOOLEAN MODE)
+    """
+    query = " UNION ALL ".join(keyword_branch for _ in keywords)
+    
+    # Quote each keyword so multi-word keywords match as a phrase and boolean
+    # operators typed by the user are taken literally
+    params = []
+    for keyword in keywords:
+        phrase = '"' + keyword.replace('"', '') + '"'
+        params.extend((keyword, phrase))
+    
+    # Prepared once per keyword count on each pooled connection; the SQL text only
+    # depends on len(keywords), never on the keywords themselves
+    results = mysql_conn.execute_query(query, tuple(params), prepared=True)
+    if results is None:
+        raise RuntimeError("MySQL keyword comparison query failed")
+    return tuple(results)
+
+def _ttl_bucket():
+    """Current QUERY_CACHE_TTL time window; passing it to a cached helper expires entries"""
+    return int(time.time() // QUERY_CACHE_TTL)
+
+@functools.lru_cache(maxsize=256)
+def _query_university_keywords(university_name, bucket):
+    """Run the university keyword query and return the result rows (bucket is the TTL window)"""
+    # Split the comma-separated keywords of publications by faculty at the selected
+    # university with a recursive CTE and count the individual keywords in MySQL; only
+    # the top 10 come back, each carrying the number of distinct keywords
+    query = """
+    WITH RECURSIVE split (keyword, rest) AS (
+        SELECT CAST(NULL AS CHAR(255)), CONCAT(LOWER(p.keywords), ',')
+        FROM publication p
+        JOIN publication_author pa ON p.id = pa.publication_id
+        JOIN faculty f ON pa.faculty_id = f.id
+        WHERE f.university = %s 
+            AND p.keywords IS NOT NULL 
+            AND p.keywords != ''
+        UNION ALL
+        SELECT TRIM(SUBSTRING_INDEX(rest, ',', 1)), SUBSTRING(rest, INSTR(rest, ',') + 1)
+        FROM split
+        WHERE rest != ''
+    )
+    SELECT 
+        keyword,
+        COUNT(*) as keyword_count,
+        COUNT(*) OVER () as unique_keywords
+    FROM split
+    WHERE CHAR_LENGTH(keyword) > 2
+    GROUP BY keyword
+    ORDER BY keyword_count DESC
+    LIMIT 10
+    """
+    
+    results = mysql_conn.execute_query(query, (university_name,))
+    if results is None:
+        raise RuntimeError("MySQL university keyword query failed")
+    return tuple(results)
+
+@functools.lru_cache(maxsize=128)
+def _query_faculty_publications(name_key, bucket):
+    """Run the faculty publication query and return the result rows (bucket is the TTL window)"""
+    # Query to get publications by faculty member (only the columns the charts and
+    # stats use - the wide abstract/keywords text stays on the server)
+    query = """
+    SELECT 
+        p.title,
+        p.year,
+        p.venue,
+        p.citations,
+        f.university,
+        f.department
+    FROM publication p
+    JOIN publication_author pa ON p.id = pa.publication_id
+    JOIN faculty f ON pa.faculty_id = f.id
+    WHERE f.name LIKE %s
+    ORDER BY p.year DESC, p.citations DESC
+    """
+    
+    # LIKE compares case-insensitively, so name_key is the lowercased, stripped name and
+    # differently typed spellings of the same search share one cache entry
+    results = mysql_conn.execute_query(query, (f'%{name_key}%',), prepared=True)
+    if results is None:
+        raise RuntimeError("MySQL faculty publications query failed")
+    return tuple(results)
+
+class _UncachedResult(Exception):
+    """Carries a widget result that must not be cached (an error or a missing database)"""
+
+def _memoize_widget(normalize_args=None):
+    """
+    Cache a widget function's result per arguments for one QUERY_CACHE_TTL window.
+    
+    (figure, info) results keep the figure as a plain dict, so repeat hits skip building
+    and validating it again. Results whose info reports an error, results built on the
+    MySQL-down placeholder, and results the function raises as _UncachedResult are not
+    cached. normalize_args maps the call arguments to the cache key arguments.
+    """
+    def decorator(func):
+        @functools.lru_cache(maxsize=128)
+        def cached(bucket, *args):
+            result = func(*args)
+            if isinstance(result, tuple):
+                fig, info = result
+                if fig is _PLACEHOLDER_FIG_MYSQL_DOWN or (isinstance(info, str) and info.startswith("Error")):
+                    raise _UncachedResult(result)
+                if isinstance(fig, go.Figure):
+                    result = (fig.to_dict(), info)
+            return result
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            if normalize_args:
+                args = normalize_args(*args)
+            try:
+                return cached(_ttl_bucket(), *args)
+            except _UncachedResult as e:
+                return e.args[0]
+        
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+def clear_query_caches():
+    """Drop all cached query results"""
+    _query_pubs_by_keyword.cache_clear()
+    _query_all_publications.cache_clear()
+    _query_keyword_stats.cache_clear()
+    _query_university_keywords.cache_clear()
+    _query_faculty_publications.cache_clear()
+    _ts_mysql.cache_clear()
+    _ts_mongo.cache_clear()
+    _ts_neo4j.cache_clear()
+    get_keyword_comparison.cache_clear()
+    get_university_keywords.cache_clear()
+    get_person_information.cache_clear()
+    get_timeseries_widget_data.cache_clear()
+    get_faculty_publications.cache_clear()
+    # The connections keep their own short-lived result caches
+    for conn in (mysql_conn, neo4j_conn):
+        if conn:
+            conn.clear_cache()
+
 # Widget data functions - TO BE IMPLEMENTED BASED ON YOUR QUERIES
 def get_publications_by_keyword(keyword):
     """Get publications by keyword from MySQL"""
     try:
-        if mysql_conn and mysql_conn.connection:
-            # Comprehensive search query that looks in title, abstract, and keywords
-            query = """
-            SELECT 
-                p.title,
-                p.year,
-                p.venue,
-                p.citations,
-                p.abstract,
-                GROUP_CONCAT(DISTINCT f.name SEPARATOR ', ') as authors
-            FROM publication p
-            LEFT JOIN publication_author pa ON p.id = pa.publication_id
-            LEFT JOIN faculty f ON pa.faculty_id = f.id
-            WHERE 
-                p.title LIKE %s 
-                OR p.abstract LIKE %s 
-                OR p.keywords LIKE %s
-                OR p.venue LIKE %s
-            GROUP BY p.id, p.title, p.year, p.venue, p.citations, p.abstract
-            ORDER BY p.citations DESC, p.year DESC
-            LIMIT 20
-            """
-            
-            search_term = f'%{keyword}%'
-            results = mysql_conn.execute_query(query, (search_term, search_term, search_term, search_term))
+        if mysql_conn and mysql_conn.is_connected():
+            results = _query_pubs_by_keyword(keyword)
             
             if results:
-                # Create a bar chart showing publications by year
-                df = pd.DataFrame(results, columns=['title', 'year', 'venue', 'citations', 'abstract', 'authors'])
-                
-                # Group by year and count publications
-                year_counts = df.groupby('year').size().reset_index(name='count')
-                year_counts = year_counts.sort_values('year')
+                # Split the aggregated per-year rows from the top publication rows
+                year_counts = {}
+                total_pubs = 0
+                total_citations = 0
+                venue_counts = Counter()
+                for kind, year, count, citations, venue in results:
+                    if kind == 'agg':
+                        total_pubs += count
+                        total_citations += citations or 0
+                        if year is not None:
+                            year_counts[year] = count
+                    else:
+                        venue_counts[venue] += 1
+                years, counts = zip(*sorted(year_counts.items())) if year_counts else ((), ())
                 
                 # Create bar chart
-                fig = px.bar(
-                    year_counts, 
-                    x='year', 
-                    y='count',
-                    title=f"Publications containing '{keyword}' by Year",
-                    labels={'year': 'Year', 'count': 'Number of Publications'},
-                    color='count',
-                    color_continuous_scale='viridis'
-                )
+                fig = go.Figure(go.Bar(
+                    x=list(years),
+                    y=list(counts),
+                    marker=dict(color=list(counts), colorscale='viridis')
+                ))
                 
                 fig.update_layout(
+                    title=f"Publications containing '{keyword}' by Year",
                     xaxis_title="Year",
                     yaxis_title="Number of Publications",
                     template='plotly_white',
@@ -572,30 +837,20 @@ def get_publications_by_keyword(keyword):
                     hovertemplate="<b>Year:</b> %{x}<br><b>Publications:</b> %{y}<extra></extra>"
                 )
                 
-                # Calculate statistics
-                total_pubs = len(df)
-                avg_citations = df['citations'].mean() if 'citations' in df.columns else 0
-                top_venue = df['venue'].mode().iloc[0] if len(df) > 0 else 'N/A'
+                # Calculate statistics (top venue is taken from the most cited matches)
+                avg_citations = total_citations / total_pubs
+                top_venue = venue_counts.most_common(1)[0][0]
                 
                 info = f"Found {total_pubs} publications | Avg Citations: {avg_citations:.1f} | Top Venue: {top_venue}"
                 
             else:
-                fig = go.Figure().add_annotation(
-                    text=f"No publications found containing '{keyword}'", 
-                    x=0.5, y=0.5, showarrow=False
-                )
+                fig = _empty_fig(f"No publications found containing '{keyword}'")
                 info = f"No publications found for keyword: {keyword}"
         else:
-            fig = go.Figure().add_annotation(
-                text="MySQL not connected", 
-                x=0.5, y=0.5, showarrow=False
-            )
+            fig = _PLACEHOLDER_FIG_MYSQL_DOWN
             info = "MySQL connection not available"
     except Exception as e:
-        fig = go.Figure().add_annotation(
-            text=f"Error: {str(e)}", 
-            x=0.5, y=0.5, showarrow=False
-        )
+        fig = _empty_fig(f"Error: {str(e)}")
         info = f"Error searching publications: {str(e)}"
     
     return fig, info
@@ -603,42 +858,43 @@ def get_publications_by_keyword(keyword):
 def get_all_publications():
     """Get all publications from MySQL"""
     try:
-        if mysql_conn and mysql_conn.connection:
-            # Query to get all publications with basic info
-            query = """
-            SELECT 
-                p.title,
-                p.year,
-                p.venue,
-                p.citations,
-                GROUP_CONCAT(DISTINCT f.name SEPARATOR ', ') as authors
-            FROM publication p
-            LEFT JOIN publication_author pa ON p.id = pa.publication_id
-            LEFT JOIN faculty f ON pa.faculty_id = f.id
-            GROUP BY p.id, p.title, p.year, p.venue, p.citations
-            ORDER BY p.citations DESC, p.year DESC
-            LIMIT 50
-            """
-            
-            results = mysql_conn.execute_query(query)
+        if mysql_conn and mysql_conn.is_connected():
+            results = _query_all_publications()
             
             if results:
-                df = pd.DataFrame(results, columns=['title', 'year', 'venue', 'citations', 'authors'])
-                
-                # Create a scatter plot of citations vs year
-                fig = px.scatter(
-                    df, 
-                    x='year', 
-                    y='citations',
-                    title="All Publications: Citations vs Year",
-                    labels={'year': 'Year', 'citations': 'Citations'},
-                    hover_data=['title', 'venue', 'authors'],
-                    size='citations',
-                    color='citations',
-                    color_continuous_scale='viridis'
+                # Stream the rows straight into a typed structured array (no DataFrame);
+                # the int32 columns let Plotly ship the traces as base64 typed arrays
+                rows = np.fromiter(
+                    ((title, year, venue, citations or 0, authors)
+                     for title, year, venue, citations, authors in results),
+                    dtype=_ALL_PUBLICATIONS_DTYPE,
+                    count=len(results)
                 )
+                years = rows['year']
+                citations = rows['citations']
+                max_citations = int(citations.max())
                 
+                # Create a scatter plot of citations vs year
+                fig = go.Figure(go.Scatter(
+                    x=years,
+                    y=citations,
+                    mode='markers',
+                    marker=dict(
+                        size=citations,
+                        sizemode='area',
+                        sizeref=2.0 * max(max_citations, 1) / (20 ** 2),  # Largest marker ~20px, as in px.scatter
+                        color=citations,
+                        colorscale='viridis',
+                        showscale=True,
+                        colorbar=dict(title="Citations")
+                    ),
+                    customdata=np.column_stack((rows['title'], rows['venue'], rows['authors'])),
+                    hovertemplate="<b>%{customdata[0]}</b><br>Year: %{x}<br>Citations: %{y}"
+                                  "<br>Venue: %{customdata[1]}<br>Authors: %{customdata[2]}<extra></extra>"
+                ))
+            
                 fig.update_layout(
+                    title="All Publications: Citations vs Year",
                     xaxis_title="Year",
                     yaxis_title="Citations",
                     template='plotly_white',
@@ -646,115 +902,65 @@ def get_all_publications():
                 )
                 
                 # Calculate statistics
-                total_pubs = len(df)
-                avg_citations = df['citations'].mean() if 'citations' in df.columns else 0
-                max_citations = df['citations'].max() if 'citations' in df.columns else 0
+                total_pubs = len(rows)
+                avg_citations = citations.mean()
                 
                 info = f"Showing {total_pubs} publications | Avg Citations: {avg_citations:.1f} | Max Citations: {max_citations}"
                 
             else:
-                fig = go.Figure().add_annotation(
-                    text="No publications found in database", 
-                    x=0.5, y=0.5, showarrow=False
-                )
+                fig = _empty_fig("No publications found in database")
                 info = "No publications found in database"
         else:
-            fig = go.Figure().add_annotation(
-                text="MySQL not connected", 
-                x=0.5, y=0.5, showarrow=False
-            )
+            fig = _PLACEHOLDER_FIG_MYSQL_DOWN
             info = "MySQL connection not available"
     except Exception as e:
-        fig = go.Figure().add_annotation(
-            text=f"Error: {str(e)}", 
-            x=0.5, y=0.5, showarrow=False
-        )
+        fig = _empty_fig(f"Error: {str(e)}")
         info = f"Error retrieving publications: {str(e)}"
     
     return fig, info
 
+@_memoize_widget(normalize_args=lambda keywords: (tuple(keywords),))
 def get_keyword_comparison(keywords):
     """Compare multiple keywords and show their publication statistics"""
     try:
-        if not mysql_conn or not mysql_conn.connection:
-            fig = go.Figure().add_annotation(
-                text="MySQL not connected", 
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig, "MySQL connection not available"
+        if not mysql_conn or not mysql_conn.is_connected():
+            return _PLACEHOLDER_FIG_MYSQL_DOWN, "MySQL connection not available"
         
-        # Collect data for each keyword
-        keyword_data = []
+        # Collect data for all keywords in a single round-trip
+        results = _query_keyword_stats(tuple(keywords))
+        stats_by_keyword = {row[0].lower(): row[1:] for row in results}
         
+        # Columnar lists in input order, fed to Plotly as-is
+        keyword_names = []
+        publication_counts = []
+        avg_citations = []
         for keyword in keywords:
-            # Search for publications containing this keyword
-            query = """
-            SELECT 
-                COUNT(*) as publication_count,
-                AVG(citations) as avg_citations,
-                MAX(citations) as max_citations,
-                MIN(year) as earliest_year,
-                MAX(year) as latest_year,
-                COUNT(DISTINCT venue) as unique_venues
-            FROM publications 
-            WHERE LOWER(title) LIKE LOWER(%s) 
-               OR LOWER(abstract) LIKE LOWER(%s) 
-               OR LOWER(keywords) LIKE LOWER(%s)
-               OR LOWER(venue) LIKE LOWER(%s)
-            """
-            
-            search_term = f"%{keyword}%"
-            results = mysql_conn.execute_query(query, (search_term, search_term, search_term, search_term))
-            
-            if results and len(results) > 0:
-                row = results[0]
-                keyword_data.append({
-                    'keyword': keyword,
-                    'publication_count': row[0] or 0,
-                    'avg_citations': float(row[1]) if row[1] else 0,
-                    'max_citations': row[2] or 0,
-                    'earliest_year': row[3] or 0,
-                    'latest_year': row[4] or 0,
-                    'unique_venues': row[5] or 0
-                })
-            else:
-                keyword_data.append({
-                    'keyword': keyword,
-                    'publication_count': 0,
-                    'avg_citations': 0,
-                    'max_citations': 0,
-                    'earliest_year': 0,
-                    'latest_year': 0,
-                    'unique_venues': 0
-                })
+            row = stats_by_keyword.get(keyword.lower())
+            keyword_names.append(keyword)
+            publication_counts.append((row[0] or 0) if row else 0)
+            avg_citations.append(float(row[1]) if row and row[1] else 0.0)
         
-        if not keyword_data:
-            fig = go.Figure().add_annotation(
-                text="No data found for any keywords", 
-                x=0.5, y=0.5, showarrow=False
-            )
+        if not keyword_names:
+            fig = _empty_fig("No data found for any keywords")
             return fig, "No data found for any keywords"
         
-        # Create comparison visualizations
-        df = pd.DataFrame(keyword_data)
-        
         # Create subplots for different metrics
         fig = go.Figure()
         
         # Add bar chart for publication count
         fig.add_trace(go.Bar(
-            x=df['keyword'],
-            y=df['publication_count'],
+            x=keyword_names,
+            y=publication_counts,
             name='Publication Count',
             marker_color='#3498db',
-            text=df['publication_count'],
+            text=publication_counts,
             textposition='auto'
         ))
         
         # Add line chart for average citations (secondary y-axis)
         fig.add_trace(go.Scatter(
-            x=df['keyword'],
-            y=df['avg_citations'],
+            x=keyword_names,
+            y=avg_citations,
             name='Avg Citations',
             yaxis='y2',
             mode='lines+markers',
@@ -775,26 +981,23 @@ def get_keyword_comparison(keywords):
         )
         
         # Create summary statistics
-        total_pubs = df['publication_count'].sum()
-        avg_citations_overall = df['avg_citations'].mean()
-        most_popular = df.loc[df['publication_count'].idxmax(), 'keyword'] if len(df) > 0 else "None"
-        highest_cited = df.loc[df['avg_citations'].idxmax(), 'keyword'] if len(df) > 0 else "None"
+        total_pubs = int(np.sum(publication_counts))
+        avg_citations_overall = float(np.mean(avg_citations))
+        most_popular = keyword_names[int(np.argmax(publication_counts))]
+        highest_cited = keyword_names[int(np.argmax(avg_citations))]
         
         info = f"Total Publications: {total_pubs} | Avg Citations: {avg_citations_overall:.1f} | Most Popular: {most_popular} | Highest Cited: {highest_cited}"
         
         return fig, info
         
     except Exception as e:
-        fig = go.Figure().add_annotation(
-            text=f"Error: {str(e)}", 
-            x=0.5, y=0.5, showarrow=False
-        )
+        fig = _empty_fig(f"Error: {str(e)}")
         return fig, f"Error comparing keywords: {str(e)}"
 
 def get_available_universities():
     """Get list of available universities from the database"""
     try:
-        if mysql_conn and mysql_conn.connection:
+        if mysql_conn and mysql_conn.is_connected():
             # Query to get distinct universities
             query = """
             SELECT DISTINCT university 
@@ -814,65 +1017,77 @@ def get_available_universities():
             logger.warning("MySQL not connected for university list")
             return []
     except Exception as e:
-        logger.error(f"Error getting universities: {e}")
+        logger.error("Error getting universities: %s", e)
         return []
 
+@functools.lru_cache(maxsize=1)
+def _universities_cached(bucket):
+    """Dropdown options for all universities for one TTL window (or until an admin refresh)"""
+    options = get_available_universities()
+    if not options:
+        # Raise instead of returning so an unavailable database is not cached
+        raise RuntimeError("University list unavailable")
+    return tuple(options)
+
+def _require_admin_token(view):
+    """Reject requests to an operator route unless they carry ADMIN_TOKEN"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        token = request.headers.get('X-Admin-Token', '')
+        if not ADMIN_TOKEN or not hmac.compare_digest(token, ADMIN_TOKEN):
+            return {'status': 'forbidden'}, 403
+        return view(*args, **kwargs)
+    return wrapper
+
+@server.route('/admin/refresh-universities', methods=['POST'])
+@_require_admin_token
+def refresh_universities():
+    """Drop the cached university list so the next dropdown load re-reads MySQL"""
+    _universities_cached.cache_clear()
+    return {'status': 'ok'}
+
+@server.route('/debug/pool')
+@_require_admin_token
+def pool_status():
+    """Connection pool usage (size, in use, waiting) for the pooled databases"""
+    return {
+        'mysql': mysql_conn.pool_stats() if mysql_conn else None,
+        'neo4j': neo4j_conn.pool_stats() if neo4j_conn else None,
+    }
+
+# The university list rarely changes - build it once at startup when MySQL is up
+if mysql_conn and mysql_conn.is_connected():
+    try:
+        _universities_cached(_ttl_bucket())
+    except RuntimeError as e:
+        logger.warning("University list not preloaded: %s", e)
+
+@_memoize_widget()
 def get_university_keywords(university_name):
     """Get top 10 keywords for a specific university"""
     try:
-        if not mysql_conn or not mysql_conn.connection:
-            fig = go.Figure().add_annotation(
-                text="MySQL not connected", 
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig, "MySQL connection not available"
-        
-        # Query to get keywords from publications by faculty at the selected university
-        query = """
-        SELECT 
-            p.keywords,
-            COUNT(*) as keyword_count
-        FROM publication p
-        JOIN publication_author pa ON p.id = pa.publication_id
-        JOIN faculty f ON pa.faculty_id = f.id
-        WHERE f.university = %s 
-            AND p.keywords IS NOT NULL 
-            AND p.keywords != ''
-        GROUP BY p.keywords
-        ORDER BY keyword_count DESC
-        LIMIT 10
-        """
+        if not mysql_conn or not mysql_conn.is_connected():
+            return _PLACEHOLDER_FIG_MYSQL_DOWN, "MySQL connection not available"
         
-        results = mysql_conn.execute_query(query, (university_name,))
+        results = _query_university_keywords(university_name, _ttl_bucket())
         
         if results:
-            # Process keywords - split comma-separated keywords and count individual ones
-            keyword_counts = {}
-            
-            for row in results:
-                keywords = row[0].split(',') if row[0] else []
-                count = row[1]
-                
-                for keyword in keywords:
-                    keyword = keyword.strip().lower()
-                    if keyword and len(keyword) > 2:  # Filter out very short keywords
-                        if keyword in keyword_counts:
-                            keyword_counts[keyword] += count
-                        else:
-                            keyword_counts[keyword] = count
+            # Rows are the top 10 keywords, already split, counted and sorted by MySQL
+            keywords = [row[0] for row in results]
+            counts = [row[1] for row in results]
+            unique_keywords = results[0][2]
             
-            # Sort by count and get top 10
-            sorted_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            
-            if sorted_keywords:
+            if keywords:
                 # Create pie chart
-                keywords, counts = zip(*sorted_keywords)
+                
+                # plotly.colors avoids pulling in plotly.express (and pandas) for a palette
+                from plotly.colors import qualitative
                 
                 fig = go.Figure(data=[go.Pie(
                     labels=keywords,
                     values=counts,
                     hole=0.3,  # Create a donut chart
-                    marker_colors=px.colors.qualitative.Set3,
+                    marker_colors=qualitative.Set3,
                     textinfo='label+percent',
                     textposition='inside',
                     insidetextorientation='radial'
@@ -895,29 +1110,19 @@ def get_university_keywords(university_name):
                 # Calculate statistics
                 total_keywords = sum(counts)
                 most_common = keywords[0] if keywords else "None"
-                unique_keywords = len(keyword_counts)
                 
                 info = f"Total Keyword Mentions: {total_keywords} | Most Common: {most_common} | Unique Keywords: {unique_keywords}"
                 
                 return fig, info
             else:
-                fig = go.Figure().add_annotation(
-                    text=f"No keywords found for {university_name}", 
-                    x=0.5, y=0.5, showarrow=False
-                )
+                fig = _empty_fig(f"No keywords found for {university_name}")
                 return fig, f"No keywords found for {university_name}"
         else:
-            fig = go.Figure().add_annotation(
-                text=f"No data found for {university_name}", 
-                x=0.5, y=0.5, showarrow=False
-            )
+            fig = _empty_fig(f"No data found for {university_name}")
             return fig, f"No data found for {university_name}"
             
     except Exception as e:
-        fig = go.Figure().add_annotation(
-            text=f"Error: {str(e)}", 
-            x=0.5, y=0.5, showarrow=False
-        )
+        fig = _empty_fig(f"Error: {str(e)}")
         return fig, f"Error analyzing university keywords: {str(e)}"
 
 def get_mongodb_widget_data():
@@ -926,23 +1131,29 @@ def get_mongodb_widget_data():
         if mongodb_conn and mongodb_conn.client:
             # TODO: Replace with your MongoDB query
             collection_name = "your_collection"  # CHANGE: Your collection name
-            documents = mongodb_conn.find_documents(collection_name, limit=10)
+            x_field = "your_x_field"  # CHANGE: Field plotted on the x axis
+            y_field = "your_y_field"  # CHANGE: Field plotted on the y axis
+            # Only fetch the two plotted fields
+            projection = {'_id': 0, x_field: 1, y_field: 1}
+            documents = mongodb_conn.find_documents(collection_name, projection=projection, limit=10)
             
             if documents:
                 # Create sample data - replace with your actual data processing
-                df = pd.DataFrame(documents)
-                fig = px.scatter(df, x=df.columns[0] if len(df.columns) > 0 else 'index', 
-                               y=df.columns[1] if len(df.columns) > 1 else 'index', 
-                               title="MongoDB Data")
+                fig = go.Figure(go.Scatter(
+                    x=[doc.get(x_field) for doc in documents],
+                    y=[doc.get(y_field) for doc in documents],
+                    mode='markers'
+                ))
+                fig.update_layout(title="MongoDB Data", xaxis_title=x_field, yaxis_title=y_field)
                 info = f"Data from MongoDB: {len(documents)} documents"
             else:
-                fig = go.Figure().add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
+                fig = _empty_fig("No data available")
                 info = "No data available from MongoDB"
         else:
-            fig = go.Figure().add_annotation(text="MongoDB not connected", x=0.5, y=0.5, showarrow=False)
+            fig = _empty_fig("MongoDB not connected")
             info = "MongoDB connection not available"
     except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
+        fig = _empty_fig(f"Error: {str(e)}")
         info = f"Error accessing MongoDB: {str(e)}"
     
     return fig, info
@@ -953,33 +1164,44 @@ def get_neo4j_widget_data():
         if neo4j_conn and neo4j_conn.driver:
             # TODO: Replace with your Neo4j query
             query = "MATCH (n) RETURN count(n) as node_count"  # Placeholder query
-            results = neo4j_conn.execute_query(query)
+            results = neo4j_conn.execute_query(query, read_only=True)
             
             if results:
                 # Create sample data - replace with your actual data processing
-                df = pd.DataFrame(results)
-                fig = px.pie(df, values=df.columns[0] if len(df.columns) > 0 else 'index', 
-                           names=df.columns[0] if len(df.columns) > 0 else 'index', 
-                           title="Neo4j Data")
+                fig = go.Figure(go.Pie(values=[results[0]['node_count']], labels=['Total']))
+                fig.update_layout(title="Neo4j Data")
                 info = f"Data from Neo4j: {len(results)} results"
             else:
-                fig = go.Figure().add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
+                fig = _empty_fig("No data available")
                 info = "No data available from Neo4j"
         else:
-            fig = go.Figure().add_annotation(text="Neo4j not connected", x=0.5, y=0.5, showarrow=False)
+            fig = _empty_fig("Neo4j not connected")
             info = "Neo4j connection not available"
     except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
+        fig = _empty_fig(f"Error: {str(e)}")
         info = f"Error accessing Neo4j: {str(e)}"
     
     return fig, info
 
-def get_person_information(person_name):
-    """Get comprehensive information about a person from all databases"""
-    all_results = []
+# Markdown punctuation that could reformat a card or turn a value into a link
+_MARKDOWN_SPECIAL_RE = re.compile(r'([\\`*_{}\[\]()#+\-.!|<>~])')
+
+def _escape_markdown(value):
+    """Database text as literal Markdown: punctuation backslash-escaped, one line"""
+    return _MARKDOWN_SPECIAL_RE.sub(r'\\\1', ' '.join(str(value).split()))
+
+def _markdown_card(fields, style):
+    """Result card as a single Markdown component, one bold "Label:" line per (label, value)"""
+    return dcc.Markdown("  \n".join(f"**{label}:** {_escape_markdown(value)}" for label, value in fields),
+                        style=style)
+
+def _mysql_person_results(person_name):
+    """MySQL faculty and publication cards for a person search, and whether the search ran"""
+    results = []
+    ok = False
     
     # MySQL Search
-    if mysql_conn and mysql_conn.connection:
+    if mysql_conn and mysql_conn.is_connected():
         try:
             # Search in faculty table
             faculty_query = """
@@ -987,27 +1209,20 @@ def get_person_information(person_name):
             FROM faculty 
             WHERE name LIKE %s
             """
-            faculty_results = mysql_conn.execute_query(faculty_query, (f'%{person_name}%',))
+            faculty_results = mysql_conn.execute_query(faculty_query, (f'%{person_name}%',), prepared=True)
             
             if faculty_results:
-                all_results.append(html.H5("📊 MySQL - Faculty Information", style={'color': '#2980b9', 'marginTop': 20}))
+                results.append(html.H5("📊 MySQL - Faculty Information", style=_SECTION_STYLE_MYSQL))
                 for faculty in faculty_results:
-                    faculty_info = html.Div([
-                        html.Strong(f"Name: {faculty[1]}"),
-                        html.Br(),
-                        html.Span(f"Email: {faculty[2] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Position: {faculty[4] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Department: {faculty[7] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"University: {faculty[8] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Research: {faculty[5] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Interests: {faculty[6] or 'N/A'}")
-                    ], style={'backgroundColor': '#f8f9fa', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #dee2e6'})
-                    all_results.append(faculty_info)
+                    results.append(_markdown_card([
+                        ("Name", faculty[1]),
+                        ("Email", faculty[2] or 'N/A'),
+                        ("Position", faculty[4] or 'N/A'),
+                        ("Department", faculty[7] or 'N/A'),
+                        ("University", faculty[8] or 'N/A'),
+                        ("Research", faculty[5] or 'N/A'),
+                        ("Interests", faculty[6] or 'N/A')
+                    ], _FACULTY_CARD_STYLE_MYSQL))
             
             # Search in publications table for author
             pub_query = """
@@ -1019,261 +1234,275 @@ def get_person_information(person_name):
             ORDER BY p.year DESC
             LIMIT 10
             """
-            pub_results = mysql_conn.execute_query(pub_query, (f'%{person_name}%',))
+            pub_results = mysql_conn.execute_query(pub_query, (f'%{person_name}%',), prepared=True)
             
             if pub_results:
-                all_results.append(html.H5("📚 MySQL - Publications", style={'color': '#2980b9', 'marginTop': 20}))
-                for pub in pub_results:
-                    pub_info = html.Div([
-                        html.Strong(f"Title: {pub[0]}"),
-                        html.Br(),
-                        html.Span(f"Year: {pub[1] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Venue: {pub[2] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Citations: {pub[3] or 0}")
-                    ], style={'backgroundColor': '#e8f5e8', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #c3e6c3'})
-                    all_results.append(pub_info)
+                results.append(html.H5("📚 MySQL - Publications", style=_SECTION_STYLE_MYSQL))
+                results.append(html.Ul([
+                    html.Li(f"{pub[0]} ({pub[1] or 'N/A'}) - {pub[2] or 'N/A'}, {pub[3] or 0} citations")
+                    for pub in pub_results
+                ], style=_PUBLICATION_LIST_STYLE))
+            
+            # execute_query() returns None when a query fails
+            ok = faculty_results is not None and pub_results is not None
                     
         except Exception as e:
-            logger.warning(f"MySQL person search failed: {e}")
+            logger.warning("MySQL person search failed: %s", e)
+    
+    return results, ok
+
+def _mongodb_person_results(person_name):
+    """MongoDB faculty and publication cards for a person search, and whether the search ran"""
+    results = []
+    ok = False
     
     # MongoDB Search
     if mongodb_conn and mongodb_conn.client:
         try:
             # Search in faculty collection
             faculty_filter = {"name": {"$regex": person_name, "$options": "i"}}
-            faculty_docs = mongodb_conn.find_documents("faculty", faculty_filter, limit=5)
+            faculty_projection = {'_id': 0, 'name': 1, 'email': 1, 'position': 1, 'department': 1, 'research_areas': 1}
+            faculty_docs = mongodb_conn.find_documents("faculty", faculty_filter, faculty_projection, limit=5)
             
             if faculty_docs:
-                all_results.append(html.H5("🍃 MongoDB - Faculty Information", style={'color': '#27ae60', 'marginTop': 20}))
+                results.append(html.H5("🍃 MongoDB - Faculty Information", style=_SECTION_STYLE_MONGODB))
                 for faculty in faculty_docs:
-                    faculty_info = html.Div([
-                        html.Strong(f"Name: {faculty.get('name', 'N/A')}"),
-                        html.Br(),
-                        html.Span(f"Email: {faculty.get('email', 'N/A')}"),
-                        html.Br(),
-                        html.Span(f"Position: {faculty.get('position', 'N/A')}"),
-                        html.Br(),
-                        html.Span(f"Department: {faculty.get('department', 'N/A')}"),
-                        html.Br(),
-                        html.Span(f"Research Areas: {', '.join(faculty.get('research_areas', [])) if faculty.get('research_areas') else 'N/A'}")
-                    ], style={'backgroundColor': '#f0f8f0', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #a8e6a8'})
-                    all_results.append(faculty_info)
+                    results.append(_markdown_card([
+                        ("Name", faculty.get('name', 'N/A')),
+                        ("Email", faculty.get('email', 'N/A')),
+                        ("Position", faculty.get('position', 'N/A')),
+                        ("Department", faculty.get('department', 'N/A')),
+                        ("Research Areas", ', '.join(faculty['research_areas']) if faculty.get('research_areas') else 'N/A')
+                    ], _FACULTY_CARD_STYLE_MONGODB))
             
             # Search in publications collection
             pub_filter = {"authors": {"$regex": person_name, "$options": "i"}}
-            pub_docs = mongodb_conn.find_documents("publications", pub_filter, limit=5)
+            pub_projection = {'_id': 0, 'title': 1, 'year': 1, 'authors': 1, 'citations': 1}
+            pub_docs = mongodb_conn.find_documents("publications", pub_filter, pub_projection, limit=5)
             
             if pub_docs:
-                all_results.append(html.H5("🍃 MongoDB - Publications", style={'color': '#27ae60', 'marginTop': 20}))
-                for pub in pub_docs:
-                    pub_info = html.Div([
-                        html.Strong(f"Title: {pub.get('title', 'N/A')}"),
-                        html.Br(),
-                        html.Span(f"Year: {pub.get('year', 'N/A')}"),
-                        html.Br(),
-                        html.Span(f"Authors: {', '.join(pub.get('authors', [])) if pub.get('authors') else 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Citations: {pub.get('citations', 0)}")
-                    ], style={'backgroundColor': '#e8f5e8', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #c3e6c3'})
-                    all_results.append(pub_info)
+                results.append(html.H5("🍃 MongoDB - Publications", style=_SECTION_STYLE_MONGODB))
+                results.append(html.Ul([
+                    html.Li(f"{pub.get('title', 'N/A')} ({pub.get('year', 'N/A')}) - "
+                            f"{', '.join(pub['authors']) if pub.get('authors') else 'N/A'}, "
+                            f"{pub.get('citations', 0)} citations")
+                    for pub in pub_docs
+                ], style=_PUBLICATION_LIST_STYLE))
+            
+            # find_documents() returns None when a query fails
+            ok = faculty_docs is not None and pub_docs is not None
                     
         except Exception as e:
-            logger.warning(f"MongoDB person search failed: {e}")
+            logger.warning("MongoDB person search failed: %s", e)
+    
+    return results, ok
+
+def _neo4j_person_results(person_name):
+    """Neo4j person, publication and collaborator cards for a person search, and whether the search ran"""
+    results = []
+    ok = False
     
     # Neo4j Search
     if neo4j_conn and neo4j_conn.driver:
         try:
-            # Search for Person nodes
+            # People, their latest publications and their top collaborators in one round-trip;
+            # each uncorrelated CALL subquery aggregates to exactly one row
             person_query = """
-            MATCH (p:Person)
-            WHERE p.name CONTAINS $name
-            RETURN p.name as name, p.email as email, p.position as position, p.department as department
-            LIMIT 5
+            CALL {
+                MATCH (p:Person)
+                WHERE p.name CONTAINS $name
+                WITH p LIMIT 5
+                RETURN collect({name: p.name, email: p.email, position: p.position, department: p.department}) AS persons
+            }
+            CALL {
+                MATCH (p:Person)-[:AUTHORED]->(pub:Publication)
+                WHERE p.name CONTAINS $name
+                WITH pub ORDER BY pub.year DESC LIMIT 10
+                RETURN collect({title: pub.title, year: pub.year, venue: pub.venue, citations: pub.citations}) AS publications
+            }
+            CALL {
+                MATCH (p1:Person)-[:AUTHORED]->(pub:Publication)<-[:AUTHORED]-(p2:Person)
+                WHERE p1.name CONTAINS $name AND p1 <> p2
+                WITH p2.name AS collaborator, count(pub) AS collaboration_count
+                ORDER BY collaboration_count DESC LIMIT 5
+                RETURN collect({collaborator: collaborator, collaboration_count: collaboration_count}) AS collaborators
+            }
+            RETURN persons, publications, collaborators
             """
-            person_results = neo4j_conn.execute_query(person_query, {"name": person_name})
+            records = neo4j_conn.execute_query(person_query, {"name": person_name}, read_only=True)
+            record = records[0] if records else {}
+            person_results = record.get('persons')
+            pub_results = record.get('publications')
+            collab_results = record.get('collaborators')
             
             if person_results:
-                all_results.append(html.H5("🕸️ Neo4j - Person Information", style={'color': '#e67e22', 'marginTop': 20}))
+                results.append(html.H5("🕸️ Neo4j - Person Information", style=_SECTION_STYLE_NEO4J))
                 for person in person_results:
-                    person_info = html.Div([
-                        html.Strong(f"Name: {person[0] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Email: {person[1] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Position: {person[2] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Department: {person[3] or 'N/A'}")
-                    ], style={'backgroundColor': '#fff8e1', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #ffcc80'})
-                    all_results.append(person_info)
-            
-            # Search for publications by this person
-            pub_query = """
-            MATCH (p:Person)-[:AUTHORED]->(pub:Publication)
-            WHERE p.name CONTAINS $name
-            RETURN pub.title as title, pub.year as year, pub.venue as venue, pub.citations as citations
-            ORDER BY pub.year DESC
-            LIMIT 10
-            """
-            pub_results = neo4j_conn.execute_query(pub_query, {"name": person_name})
+                    results.append(_markdown_card([
+                        ("Name", person['name'] or 'N/A'),
+                        ("Email", person['email'] or 'N/A'),
+                        ("Position", person['position'] or 'N/A'),
+                        ("Department", person['department'] or 'N/A')
+                    ], _PERSON_CARD_STYLE_NEO4J))
             
             if pub_results:
-                all_results.append(html.H5("🕸️ Neo4j - Publications", style={'color': '#e67e22', 'marginTop': 20}))
-                for pub in pub_results:
-                    pub_info = html.Div([
-                        html.Strong(f"Title: {pub[0] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Year: {pub[1] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Venue: {pub[2] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Citations: {pub[3] or 0}")
-                    ], style={'backgroundColor': '#e8f5e8', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #c3e6c3'})
-                    all_results.append(pub_info)
-            
-            # Search for collaborations
-            collab_query = """
-            MATCH (p1:Person)-[:AUTHORED]->(pub:Publication)<-[:AUTHORED]-(p2:Person)
-            WHERE p1.name CONTAINS $name AND p1 <> p2
-            RETURN p2.name as collaborator, count(pub) as collaboration_count
-            ORDER BY collaboration_count DESC
-            LIMIT 5
-            """
-            collab_results = neo4j_conn.execute_query(collab_query, {"name": person_name})
+                results.append(html.H5("🕸️ Neo4j - Publications", style=_SECTION_STYLE_NEO4J))
+                results.append(html.Ul([
+                    html.Li(f"{pub['title'] or 'N/A'} ({pub['year'] or 'N/A'}) - "
+                            f"{pub['venue'] or 'N/A'}, {pub['citations'] or 0} citations")
+                    for pub in pub_results
+                ], style=_PUBLICATION_LIST_STYLE))
             
             if collab_results:
-                all_results.append(html.H5("🕸️ Neo4j - Top Collaborators", style={'color': '#e67e22', 'marginTop': 20}))
-                for collab in collab_results:
-                    collab_info = html.Div([
-                        html.Strong(f"Collaborator: {collab[0] or 'N/A'}"),
-                        html.Br(),
-                        html.Span(f"Joint Publications: {collab[1] or 0}")
-                    ], style={'backgroundColor': '#f3e5f5', 'padding': 10, 'margin': 5, 'borderRadius': 5, 'border': '1px solid #ce93d8'})
-                    all_results.append(collab_info)
+                results.append(html.H5("🕸️ Neo4j - Top Collaborators", style=_SECTION_STYLE_NEO4J))
+                results.append(html.Ul([
+                    html.Li(f"{collab['collaborator'] or 'N/A'} - {collab['collaboration_count'] or 0} joint publications")
+                    for collab in collab_results
+                ], style=_COLLABORATOR_LIST_STYLE))
+            
+            # execute_query() returns None when the query fails
+            ok = records is not None
                     
         except Exception as e:
-            logger.warning(f"Neo4j person search failed: {e}")
+            logger.warning("Neo4j person search failed: %s", e)
+    
+    return results, ok
+
+# Keyed on the stripped name only: Neo4j's CONTAINS is case-sensitive, so differently
+# cased names can give different results
+@_memoize_widget(normalize_args=lambda person_name: (person_name.strip(),))
+def get_person_information(person_name):
+    """Get comprehensive information about a person from all databases"""
+    # The three backends are independent network round-trips, so query them in parallel
+    # and keep the MySQL, MongoDB, Neo4j order when assembling the cards
+    all_results = []
+    all_ok = True
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(search, person_name)
+                   for search in (_mysql_person_results, _mongodb_person_results, _neo4j_person_results)]
+        for future in futures:
+            results, ok = future.result()
+            all_results.extend(results)
+            all_ok = all_ok and ok
     
     # If no results found
     if not all_results:
-        return html.Div([
+        result = html.Div([
             html.H5("🔍 Search Results", style={'color': '#e74c3c'}),
             html.P(f"No information found for '{person_name}' in any database.", 
-                   style={'color': '#7f8c8d', 'fontStyle': 'italic'})
+                   style=_HINT_STYLE)
+        ])
+    else:
+        result = html.Div([
+            html.H4(f"🔍 Search Results for '{person_name}'", style={'color': '#2c3e50', 'marginBottom': 20}),
+            html.Div(all_results)
         ])
     
-    # Return all results
-    return html.Div([
-        html.H4(f"🔍 Search Results for '{person_name}'", style={'color': '#2c3e50', 'marginBottom': 20}),
-        html.Div(all_results)
-    ])
+    # A database that was down or failed would leave the result incomplete for the
+    # whole TTL window, so only complete results are cached
+    if not all_ok:
+        raise _UncachedResult(result)
+    return result
+
+def _publication_series(rows):
+    """Split date-ordered (date, count) rows into (dates, counts) tuples for Plotly"""
+    return tuple(row[0] for row in rows), tuple(row[1] for row in rows)
 
+# Publications-per-day series for widget 5, one helper per database. Each is cached for
+# one QUERY_CACHE_TTL window; failed queries raise so they are not cached.
+@functools.lru_cache(maxsize=1)
+def _ts_mysql(bucket):
+    """Daily publication counts from MySQL (assuming publications table), or None"""
+    if not mysql_conn or not mysql_conn.is_connected():
+        return None
+    query = """
+    SELECT DATE(publication_date) as date, COUNT(*) as count 
+    FROM publications 
+    WHERE publication_date IS NOT NULL 
+    GROUP BY DATE(publication_date) 
+    ORDER BY date
+    """
+    results = mysql_conn.execute_query(query)
+    if results is None:
+        raise RuntimeError("MySQL publications query failed")
+    return _publication_series(results)
+
+@functools.lru_cache(maxsize=1)
+def _ts_mongo(bucket):
+    """Daily publication counts from MongoDB (assuming publications collection), or None"""
+    if not mongodb_conn or not mongodb_conn.client:
+        return None
+    pipeline = [
+        {"$match": {"publication_date": {"$exists": True}}},
+        {"$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$publication_date"}},
+            "count": {"$sum": 1}
+        }},
+        {"$sort": {"_id": 1}}
+    ]
+    collection_name = "publications"
+    documents = mongodb_conn.aggregate(collection_name, pipeline)
+    if documents is None:
+        raise RuntimeError("MongoDB publications aggregation failed")
+    return _publication_series([(doc['_id'], doc['count']) for doc in documents])
+
+@functools.lru_cache(maxsize=1)
+def _ts_neo4j(bucket):
+    """Daily publication counts from Neo4j (assuming Publication nodes), or None"""
+    if not neo4j_conn or not neo4j_conn.driver:
+        return None
+    query = """
+    MATCH (p:Publication)
+    WHERE p.publication_date IS NOT NULL
+    RETURN date(p.publication_date) as date, count(p) as count
+    ORDER BY date
+    """
+    result = neo4j_conn.execute_query_columnar(query)
+    if result is None:
+        raise RuntimeError("Neo4j publications query failed")
+    # Neo4j dates print as ISO strings, which Plotly parses
+    return _publication_series([(str(date), count) for date, count in result[1]])
+
+@_memoize_widget()
 def get_timeseries_widget_data():
     """Get data for Widget 5 - Publications Over Time"""
     try:
-        # Try to get publication data from different databases
-        publication_data = []
-        
-        # Try MySQL first (assuming publications table)
-        if mysql_conn and mysql_conn.connection:
+        # Use the first database that has publication dates; every query already returns
+        # one row per date in date order, so the rows go to Plotly as-is
+        dates, counts, source = (), (), None
+        bucket = _ttl_bucket()
+        for source_name, fetch_series in (('MySQL', _ts_mysql), ('MongoDB', _ts_mongo), ('Neo4j', _ts_neo4j)):
             try:
-                query = """
-                SELECT DATE(publication_date) as date, COUNT(*) as count 
-                FROM publications 
-                WHERE publication_date IS NOT NULL 
-                GROUP BY DATE(publication_date) 
-                ORDER BY date
-                """
-                results = mysql_conn.execute_query(query)
-                if results:
-                    for row in results:
-                        publication_data.append({
-                            'date': row[0],
-                            'count': row[1],
-                            'source': 'MySQL'
-                        })
+                series = fetch_series(bucket)
             except Exception as e:
-                logger.warning(f"MySQL publications query failed: {e}")
-        
-        # Try MongoDB (assuming publications collection)
-        if mongodb_conn and mongodb_conn.client and not publication_data:
-            try:
-                pipeline = [
-                    {"$match": {"publication_date": {"$exists": True}}},
-                    {"$group": {
-                        "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$publication_date"}},
-                        "count": {"$sum": 1}
-                    }},
-                    {"$sort": {"_id": 1}}
-                ]
-                collection_name = "publications"
-                documents = mongodb_conn.execute_aggregation(collection_name, pipeline)
-                if documents:
-                    for doc in documents:
-                        publication_data.append({
-                            'date': doc['_id'],
-                            'count': doc['count'],
-                            'source': 'MongoDB'
-                        })
-            except Exception as e:
-                logger.warning(f"MongoDB publications query failed: {e}")
-        
-        # Try Neo4j (assuming Publication nodes)
-        if neo4j_conn and neo4j_conn.driver and not publication_data:
-            try:
-                query = """
-                MATCH (p:Publication)
-                WHERE p.publication_date IS NOT NULL
-                RETURN date(p.publication_date) as date, count(p) as count
-                ORDER BY date
-                """
-                results = neo4j_conn.execute_query(query)
-                if results:
-                    for row in results:
-                        publication_data.append({
-                            'date': row[0],
-                            'count': row[1],
-                            'source': 'Neo4j'
-                        })
-            except Exception as e:
-                logger.warning(f"Neo4j publications query failed: {e}")
+                logger.warning("%s publications query failed: %s", source_name, e)
+                continue
+            if series is not None and series[0]:
+                dates, counts = series
+                source = source_name
+                break
         
         # If no real data found, create sample data for demonstration
-        if not publication_data:
-            # Generate sample publication data for the last 12 months
-            from datetime import datetime, timedelta
-            import random
-            
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365)
-            current_date = start_date
-            
-            while current_date <= end_date:
-                # Simulate more publications on weekdays and fewer on weekends
-                base_count = 5 if current_date.weekday() < 5 else 2
-                count = base_count + random.randint(-2, 3)
-                count = max(0, count)  # Ensure non-negative
-                
-                publication_data.append({
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'count': count,
-                    'source': 'Sample Data'
-                })
-                current_date += timedelta(days=1)
+        if not len(dates):
+            # Generate sample publication data for the last 12 months, whole arrays at once
+            today = np.datetime64('today', 'D')
+            dates = np.arange(today - 365, today + 1)
+            # Simulate more publications on weekdays and fewer on weekends
+            # (1970-01-01 was a Thursday, so (days + 3) % 7 is the weekday with Monday = 0)
+            weekdays = (dates.astype('int64') + 3) % 7
+            base_counts = np.where(weekdays < 5, 5, 2)
+            noise = np.random.default_rng().integers(-2, 4, size=len(dates))
+            counts = np.clip(base_counts + noise, 0, None)  # Ensure non-negative
+            source = 'Sample Data'
         
         # Create the time series visualization
-        if publication_data:
-            df = pd.DataFrame(publication_data)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-            
+        if len(dates):
             # Create line chart with area fill
             fig = go.Figure()
             
             fig.add_trace(go.Scatter(
-                x=df['date'],
-                y=df['count'],
+                x=dates,
+                y=counts,
                 mode='lines+markers',
                 name='Publications',
                 line=dict(color='#1f77b4', width=3),
@@ -1306,177 +1535,168 @@ def get_timeseries_widget_data():
                 )
             )
             
-            total_pubs = df['count'].sum()
-            avg_daily = df['count'].mean()
-            source = df['source'].iloc[0]
+            total_pubs = int(np.sum(counts))
+            avg_daily = total_pubs / len(counts)
             info = f"Total Publications: {total_pubs} | Avg Daily: {avg_daily:.1f} | Source: {source}"
         else:
-            fig = go.Figure().add_annotation(
-                text="No publication data available", 
-                x=0.5, y=0.5, showarrow=False
-            )
+            fig = _empty_fig("No publication data available")
             info = "No publication data found in any database"
             
     except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
+        fig = _empty_fig(f"Error: {str(e)}")
         info = f"Error in publications widget: {str(e)}"
+        source = None
     
+    # Sample data stands in for failed or empty databases; it is not cached, so real
+    # data shows up as soon as a database answers again
+    if source == 'Sample Data':
+        raise _UncachedResult((fig, info))
     return fig, info
 
+@functools.lru_cache(maxsize=1)
+def _faculty_figure_template():
+    """Four-panel faculty figure with subplots, axis labels and layout but no traces"""
+    from plotly.subplots import make_subplots
+    
+    # Create subplots: 2 rows, 2 columns
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Publications by Year', 'Citations Distribution', 'Top Venues', 'Research Timeline'),
+        specs=[[{"type": "bar"}, {"type": "histogram"}],
+               [{"type": "bar"}, {"type": "scatter"}]]
+    )
+    
+    # Update layout
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        template='plotly_white'
+    )
+    
+    # Update axes labels
+    fig.update_xaxes(title_text="Year", row=1, col=1)
+    fig.update_yaxes(title_text="Number of Publications", row=1, col=1)
+    fig.update_xaxes(title_text="Citations", row=1, col=2)
+    fig.update_yaxes(title_text="Frequency", row=1, col=2)
+    fig.update_xaxes(title_text="Venue", row=2, col=1)
+    fig.update_yaxes(title_text="Number of Publications", row=2, col=1)
+    fig.update_xaxes(title_text="Year", row=2, col=2)
+    fig.update_yaxes(title_text="Citations", row=2, col=2)
+    
+    return fig
+
+# Summary line under the faculty charts, filled from the stats dict
+_format_faculty_info = (
+    "Total Publications: {total_pubs} | Total Citations: {total_citations} | "
+    "Avg Citations: {avg_citations:.1f} | H-index: {h_index} | Years Active: {years_active} | "
+    "Top Venue: {top_venue} | University: {university} | Department: {department}"
+).format_map
+
+@_memoize_widget()
 def get_faculty_publications(faculty_name):
     """Get all publications by a specific faculty member"""
     try:
-        if not mysql_conn or not mysql_conn.connection:
-            fig = go.Figure().add_annotation(
-                text="MySQL not connected", 
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig, "MySQL connection not available"
+        if not mysql_conn or not mysql_conn.is_connected():
+            return _PLACEHOLDER_FIG_MYSQL_DOWN, "MySQL connection not available"
         
-        # Query to get publications by faculty member
-        query = """
-        SELECT 
-            p.title,
-            p.year,
-            p.venue,
-            p.citations,
-            p.abstract,
-            p.keywords,
-            f.name as faculty_name,
-            f.university,
-            f.department
-        FROM publication p
-        JOIN publication_author pa ON p.id = pa.publication_id
-        JOIN faculty f ON pa.faculty_id = f.id
-        WHERE f.name LIKE %s
-        ORDER BY p.year DESC, p.citations DESC
-        """
-        
-        search_term = f'%{faculty_name}%'
-        results = mysql_conn.execute_query(query, (search_term,))
+        results = _query_faculty_publications(faculty_name.strip().lower(), _ttl_bucket())
         
         if results:
-            # Create DataFrame
-            df = pd.DataFrame(results, columns=['title', 'year', 'venue', 'citations', 'abstract', 'keywords', 'faculty_name', 'university', 'department'])
+            # Create DataFrame (a fresh frame per call, so the column casts below never
+            # touch the cached rows)
+            import pandas as pd
+            df = pd.DataFrame(results, columns=['title', 'year', 'venue', 'citations', 'university', 'department'])
+            # Fixed-width integer columns keep counting and hashing off the object-dtype path;
+            # year is nullable, so publications without one are kept but left out of the
+            # year counts and the timeline
+            df['year'] = df['year'].astype('Int32')
+            df['citations'] = df['citations'].fillna(0).astype('int32')
             
-            # Create multiple visualizations
-            fig = go.Figure()
+            year_counts = df['year'].value_counts().sort_index().astype('int64')
+            venue_counts = df['venue'].value_counts().head(10)
             
-            # Create subplots for different views
-            from plotly.subplots import make_subplots
+            # Hand the traces raw int32/float32 arrays, pulled out of the frame once; Plotly
+            # serializes NumPy arrays as compact typed arrays instead of per-number JSON
+            years = df['year'].to_numpy(dtype=np.float32, na_value=np.nan)
+            citations = df['citations'].to_numpy()
+            titles = df['title'].to_numpy(dtype=object)
+            marker_sizes = citations.astype(np.float32) / 10 + 5  # Size based on citations
             
-            # Create subplots: 1 row, 2 columns
-            fig = make_subplots(
-                rows=2, cols=2,
-                subplot_titles=('Publications by Year', 'Citations Distribution', 'Top Venues', 'Research Timeline'),
-                specs=[[{"type": "bar"}, {"type": "histogram"}],
-                       [{"type": "bar"}, {"type": "scatter"}]]
-            )
+            # Create multiple visualizations on a copy of the prebuilt four-panel figure
+            fig = go.Figure(_faculty_figure_template())
             
             # 1. Publications by Year (Bar Chart)
-            year_counts = df.groupby('year').size().reset_index(name='count')
-            year_counts = year_counts.sort_values('year')
-            
             fig.add_trace(
-                go.Bar(x=year_counts['year'], y=year_counts['count'], name='Publications', marker_color='#3498db'),
+                go.Bar(x=year_counts.index.to_numpy(dtype=np.int32), y=year_counts.values, name='Publications', marker_color='#3498db'),
                 row=1, col=1
             )
             
             # 2. Citations Distribution (Histogram)
             fig.add_trace(
-                go.Histogram(x=df['citations'], name='Citations', nbinsx=20, marker_color='#e74c3c'),
+                go.Histogram(x=citations, name='Citations', nbinsx=20, marker_color='#e74c3c'),
                 row=1, col=2
             )
             
             # 3. Top Venues (Bar Chart)
-            venue_counts = df.groupby('venue').size().reset_index(name='count')
-            venue_counts = venue_counts.sort_values('count', ascending=False).head(10)
-            
             fig.add_trace(
-                go.Bar(x=venue_counts['venue'], y=venue_counts['count'], name='Venues', marker_color='#2ecc71'),
+                go.Bar(x=venue_counts.index, y=venue_counts.values, name='Venues', marker_color='#2ecc71'),
                 row=2, col=1
             )
             
             # 4. Research Timeline (Scatter Plot)
             fig.add_trace(
                 go.Scatter(
-                    x=df['year'], 
-                    y=df['citations'], 
+                    x=years, 
+                    y=citations, 
                     mode='markers',
                     name='Publications',
                     marker=dict(
-                        size=df['citations']/10 + 5,  # Size based on citations
-                        color=df['citations'],
+                        size=marker_sizes,
+                        color=citations,
                         colorscale='Viridis',
                         showscale=True,
                         colorbar=dict(title="Citations")
                     ),
-                    text=df['title'],
+                    text=titles,
                     hovertemplate="<b>%{text}</b><br>Year: %{x}<br>Citations: %{y}<extra></extra>"
                 ),
                 row=2, col=2
             )
             
-            # Update layout
-            fig.update_layout(
-                title=f"Publications by {faculty_name}",
-                height=600,
-                showlegend=False,
-                template='plotly_white'
-            )
-            
-            # Update axes labels
-            fig.update_xaxes(title_text="Year", row=1, col=1)
-            fig.update_yaxes(title_text="Number of Publications", row=1, col=1)
-            fig.update_xaxes(title_text="Citations", row=1, col=2)
-            fig.update_yaxes(title_text="Frequency", row=1, col=2)
-            fig.update_xaxes(title_text="Venue", row=2, col=1)
-            fig.update_yaxes(title_text="Number of Publications", row=2, col=1)
-            fig.update_xaxes(title_text="Year", row=2, col=2)
-            fig.update_yaxes(title_text="Citations", row=2, col=2)
+            fig.update_layout(title=f"Publications by {faculty_name}")
             
-            # Calculate statistics
-            total_pubs = len(df)
-            total_citations = df['citations'].sum()
-            avg_citations = df['citations'].mean()
-            h_index = len(df[df['citations'] >= df['citations'].rank(ascending=False)])
-            years_active = df['year'].max() - df['year'].min() + 1
-            top_venue = df['venue'].mode().iloc[0] if len(df) > 0 else 'N/A'
-            university = df['university'].iloc[0] if len(df) > 0 else 'N/A'
-            department = df['department'].iloc[0] if len(df) > 0 else 'N/A'
+            # Calculate statistics from the raw column arrays
+            # h-index: largest rank r such that the r-th most cited paper has >= r citations
+            cited = np.sort(citations)[::-1]
+            stats = {
+                'total_pubs': cited.size,
+                'total_citations': cited.sum(),
+                'avg_citations': cited.mean(),
+                'h_index': int((cited >= np.arange(1, cited.size + 1)).sum()),
+                'years_active': (int(year_counts.index.max() - year_counts.index.min()) + 1
+                                 if len(year_counts) > 0 else 'N/A'),
+                # venue_counts is already ordered by frequency for the Top Venues chart
+                'top_venue': venue_counts.index[0] if len(venue_counts) > 0 else 'N/A',
+                'university': df['university'].iloc[0] if len(df) > 0 else 'N/A',
+                'department': df['department'].iloc[0] if len(df) > 0 else 'N/A',
+            }
             
-            info = f"Total Publications: {total_pubs} | Total Citations: {total_citations} | Avg Citations: {avg_citations:.1f} | H-index: {h_index} | Years Active: {years_active} | Top Venue: {top_venue} | University: {university} | Department: {department}"
+            info = _format_faculty_info(stats)
             
         else:
-            fig = go.Figure().add_annotation(
-                text=f"No publications found for faculty member '{faculty_name}'", 
-                x=0.5, y=0.5, showarrow=False
-            )
+            fig = _empty_fig(f"No publications found for faculty member '{faculty_name}'")
             info = f"No publications found for faculty member: {faculty_name}"
             
     except Exception as e:
-        fig = go.Figure().add_annotation(
-            text=f"Error: {str(e)}", 
-            x=0.5, y=0.5, showarrow=False
-        )
+        fig = _empty_fig(f"Error: {str(e)}")
         info = f"Error searching faculty publications: {str(e)}"
     
     return fig, info
 
 def get_summary_widget_data():
     """Get data for Widget 6 - Summary Statistics (now Faculty Publication Search)"""
-    try:
-        # This function is now replaced by the faculty search functionality
-        fig = go.Figure().add_annotation(
-            text="Enter a faculty member name above to search their publications", 
-            x=0.5, y=0.5, showarrow=False
-        )
-        info = "Widget 6 now allows faculty publication search"
-    except Exception as e:
-        fig = go.Figure().add_annotation(text=f"Error: {str(e)}", x=0.5, y=0.5, showarrow=False)
-        info = f"Error in faculty search widget: {str(e)}"
-    
-    return fig, info
+    # This function is now replaced by the faculty search functionality
+    return _PLACEHOLDER_FIG_SUMMARY, "Widget 6 now allows faculty publication search"
 
 if __name__ == '__main__':
     print("Starting Multi-Database Dashboard...")
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+import functools
+import re
+import threading
+import time
+from typing import Optional, List, Dict, Any, Hashable
+
+# Identifiers spliced into SQL or Cypher (table names, labels, relationship types,
+# property names) must match this
+_IDENT_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Seconds a caller waits for a free pooled connection before giving up
+DEFAULT_POOL_TIMEOUT = 30
+
+
+@functools.lru_cache(maxsize=1024)
+def safe_ident(name: str) -> str:
+    """
+    Return name as a back-ticked identifier (the quoting MySQL and Cypher share).
+    
+    Identifiers cannot be query parameters, so anything spliced into the query text is
+    checked first; this keeps user input from injecting SQL or Cypher.
+    
+    Raises:
+        ValueError: If name is not a plain identifier
+    """
+    if not isinstance(name, str) or not _IDENT_RE.fullmatch(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return f"`{name}`"
+
+
+class ResultCache:
+    """Thread-safe LRU cache of query results that expire after a fixed TTL."""
+    
+    def __init__(self, ttl: float = 60, size: int = 512):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            ttl: Seconds a result is reused for (0 disables caching)
+            size: Maximum number of cached results
+        """
+        self.ttl = ttl
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[List[Any]]:
+        """Return a cached, unexpired query result or None."""
+        if not self.ttl:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return list(results)
+    
+    def put(self, key: Hashable, results):
+        """Cache a query result for ttl seconds, evicting the least recently used."""
+        if not self.ttl:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, tuple(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PoolExhaustedError(TimeoutError):
+    """No pooled connection became free within the PoolGate timeout."""
+
+
+class PoolGate:
+    """
+    Bound the number of callers using a connection pool at once.
+    
+    Callers past the pool size wait here, where they can be counted, instead of failing
+    (mysql.connector raises PoolError as soon as its pool is empty) or queueing inside
+    the driver until its acquisition timeout (Neo4j). A caller that waits longer than
+    timeout seconds gets PoolExhaustedError rather than hanging its request.
+    """
+    
+    def __init__(self, size: int, timeout: float = DEFAULT_POOL_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.waiting = 0
+    
+    def __enter__(self):
+        with self._lock:
+            self.waiting += 1
+        try:
+            acquired = self._semaphore.acquire(timeout=self.timeout)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+        if not acquired:
+            raise PoolExhaustedError(
+                f"Connection pool exhausted: all {self.size} connections still in use "
+                f"after {self.timeout}s")
+        with self._lock:
+            self.in_use += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        with self._lock:
+            self.in_use -= 1
+        self._semaphore.release()
+        return False
+    
+    def stats(self) -> Dict[str, int]:
+        """Return the pool size and the number of callers holding and waiting for it."""
+        with self._lock:
+            return {'size': self.size, 'in_use': self.in_use, 'waiting': self.waiting}
@@ -2,17 +2,28 @@ from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError, PyMongoError
 from pymongo.database import Database
 from pymongo.collection import Collection
+from bson.objectid import ObjectId
+import functools
 import os
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Iterator
 import logging
 from datetime import datetime
 import json
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_client(connection_string: str) -> MongoClient:
+    """
+    Return the process-wide MongoClient for a connection string.
+    
+    MongoClient keeps its own connection pool, so MongoDBConnection instances pointing at
+    the same server share one client instead of each opening new sockets.
+    """
+    return MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+
+
 class MongoDBConnection:
     """MongoDB database connection manager with utility methods."""
     
@@ -55,7 +66,7 @@ class MongoDBConnection:
             else:
                 connection_string = f"mongodb://{self.host}:{self.port}"
             
-            self.client = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+            self.client = _shared_client(connection_string)
             
             # Test the connection
             self.client.admin.command('ping')
@@ -63,21 +74,33 @@ class MongoDBConnection:
             if self.database_name:
                 self.database = self.client[self.database_name]
             
-            logger.info(f"Successfully connected to MongoDB at {self.host}:{self.port}")
+            logger.info("Successfully connected to MongoDB at %s:%s", self.host, self.port)
             return True
             
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
-            logger.error(f"Error connecting to MongoDB: {e}")
+            logger.error("Error connecting to MongoDB: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error connecting to MongoDB: {e}")
+            logger.error("Unexpected error connecting to MongoDB: %s", e)
             return False
     
     def disconnect(self):
-        """Close the database connection."""
+        """Release the database connection."""
         if self.client:
-            self.client.close()
-            logger.info("MongoDB connection closed.")
+            # The client is shared per process; its pool stays open for other connections
+            self.client = None
+            self.database = None
+            logger.info("MongoDB connection released.")
+    
+    def __enter__(self) -> 'MongoDBConnection':
+        """Connect on entering a with block."""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Release the connection on leaving a with block, even if it raised."""
+        self.disconnect()
+        return False
     
     def get_database(self, database_name: str = None) -> Optional[Database]:
         """
@@ -112,7 +135,7 @@ class MongoDBConnection:
             Collection object or None if connection failed
         """
         database = self.get_database(database_name)
-        if not database:
+        if database is None:
             return None
         
         return database[collection_name]
@@ -131,19 +154,19 @@ class MongoDBConnection:
             ObjectId of inserted document or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
             result = collection.insert_one(document)
-            logger.info(f"Document inserted with ID: {result.inserted_id}")
+            logger.info("Document inserted with ID: %s", result.inserted_id)
             return str(result.inserted_id)
         except PyMongoError as e:
-            logger.error(f"Error inserting document: {e}")
+            logger.error("Error inserting document: %s", e)
             return None
     
     def insert_many_documents(self, collection_name: str, documents: List[Dict[str, Any]], 
-                             database_name: str = None) -> Optional[List[str]]:
+                             database_name: str = None) -> Optional[List[ObjectId]]:
         """
         Insert multiple documents into a collection.
         
@@ -153,20 +176,58 @@ class MongoDBConnection:
             database_name: Name of the database (uses default if not specified)
             
         Returns:
-            List of ObjectIds of inserted documents or None if error
+            List of ObjectIds of inserted documents (use ids_as_str() for their string
+            form) or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
             result = collection.insert_many(documents)
-            logger.info(f"{len(result.inserted_ids)} documents inserted")
-            return [str(oid) for oid in result.inserted_ids]
+            logger.info("%s documents inserted", len(result.inserted_ids))
+            return result.inserted_ids
         except PyMongoError as e:
-            logger.error(f"Error inserting documents: {e}")
+            logger.error("Error inserting documents: %s", e)
             return None
     
+    def iter_documents(self, collection_name: str, filter_dict: Dict[str, Any] = None,
+                       projection: Dict[str, Any] = None, limit: int = 0,
+                       batch_size: int = 1000,
+                       database_name: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream documents from a collection one at a time.
+        
+        The driver fetches batch_size documents per round-trip, so only one batch is held
+        in memory instead of the whole result set.
+        
+        Args:
+            collection_name: Name of the collection
+            filter_dict: Filter criteria (default: find all)
+            projection: Fields to include/exclude
+            limit: Maximum number of documents to return
+            batch_size: Number of documents fetched from the server per batch
+            database_name: Name of the database (uses default if not specified)
+            
+        Yields:
+            Documents matching the filter (nothing if the collection is unavailable)
+            
+        Raises:
+            PyMongoError: If the query fails while iterating
+        """
+        collection = self.get_collection(collection_name, database_name)
+        if collection is None:
+            return
+        
+        cursor = collection.find(filter_dict or {}, projection or {}).batch_size(batch_size)
+        if limit > 0:
+            cursor = cursor.limit(limit)
+        
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
+    
     def find_documents(self, collection_name: str, filter_dict: Dict[str, Any] = None,
                       projection: Dict[str, Any] = None, limit: int = 0,
                       database_name: str = None) -> Optional[List[Dict[str, Any]]]:
@@ -184,19 +245,48 @@ class MongoDBConnection:
             List of documents or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
-            cursor = collection.find(filter_dict or {}, projection or {})
-            if limit > 0:
-                cursor = cursor.limit(limit)
+            documents = list(self.iter_documents(collection_name, filter_dict, projection,
+                                                 limit=limit, database_name=database_name))
+            logger.info("Found %s documents", len(documents))
+            return documents
+        except PyMongoError as e:
+            logger.error("Error finding documents: %s", e)
+            return None
+    
+    def aggregate(self, collection_name: str, pipeline: List[Dict[str, Any]],
+                  database_name: str = None, allow_disk_use: bool = True,
+                  batch_size: int = 1000) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run an aggregation pipeline on the server.
+        
+        Grouping and counting with $group/$sort/$limit stages happens in MongoDB, so only
+        the aggregated documents cross the wire instead of every raw document.
+        
+        Args:
+            collection_name: Name of the collection
+            pipeline: List of aggregation stages
+            database_name: Name of the database (uses default if not specified)
+            allow_disk_use: Let large $group/$sort stages spill to disk
+            batch_size: Number of result documents fetched per batch
             
-            documents = list(cursor)
-            logger.info(f"Found {len(documents)} documents")
+        Returns:
+            List of result documents or None if error
+        """
+        collection = self.get_collection(collection_name, database_name)
+        if collection is None:
+            return None
+        
+        try:
+            documents = list(collection.aggregate(pipeline, allowDiskUse=allow_disk_use,
+                                                  batchSize=batch_size))
+            logger.info("Aggregation returned %s documents", len(documents))
             return documents
         except PyMongoError as e:
-            logger.error(f"Error finding documents: {e}")
+            logger.error("Error running aggregation: %s", e)
             return None
     
     def find_one_document(self, collection_name: str, filter_dict: Dict[str, Any] = None,
@@ -215,7 +305,7 @@ class MongoDBConnection:
             Document or None if not found or error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
@@ -226,7 +316,7 @@ class MongoDBConnection:
                 logger.info("No document found")
             return document
         except PyMongoError as e:
-            logger.error(f"Error finding document: {e}")
+            logger.error("Error finding document: %s", e)
             return None
     
     def update_document(self, collection_name: str, filter_dict: Dict[str, Any],
@@ -246,15 +336,15 @@ class MongoDBConnection:
             Number of documents modified or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
             result = collection.update_one(filter_dict, update_dict, upsert=upsert)
-            logger.info(f"Modified {result.modified_count} document(s)")
+            logger.info("Modified %s document(s)", result.modified_count)
             return result.modified_count
         except PyMongoError as e:
-            logger.error(f"Error updating document: {e}")
+            logger.error("Error updating document: %s", e)
             return None
     
     def update_many_documents(self, collection_name: str, filter_dict: Dict[str, Any],
@@ -274,15 +364,15 @@ class MongoDBConnection:
             Number of documents modified or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
             result = collection.update_many(filter_dict, update_dict, upsert=upsert)
-            logger.info(f"Modified {result.modified_count} document(s)")
+            logger.info("Modified %s document(s)", result.modified_count)
             return result.modified_count
         except PyMongoError as e:
-            logger.error(f"Error updating documents: {e}")
+            logger.error("Error updating documents: %s", e)
             return None
     
     def delete_document(self, collection_name: str, filter_dict: Dict[str, Any],
@@ -299,15 +389,15 @@ class MongoDBConnection:
             Number of documents deleted or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
             result = collection.delete_one(filter_dict)
-            logger.info(f"Deleted {result.deleted_count} document(s)")
+            logger.info("Deleted %s document(s)", result.deleted_count)
             return result.deleted_count
         except PyMongoError as e:
-            logger.error(f"Error deleting document: {e}")
+            logger.error("Error deleting document: %s", e)
             return None
     
     def delete_many_documents(self, collection_name: str, filter_dict: Dict[str, Any],
@@ -324,15 +414,15 @@ class MongoDBConnection:
             Number of documents deleted or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
             result = collection.delete_many(filter_dict)
-            logger.info(f"Deleted {result.deleted_count} document(s)")
+            logger.info("Deleted %s document(s)", result.deleted_count)
             return result.deleted_count
         except PyMongoError as e:
-            logger.error(f"Error deleting documents: {e}")
+            logger.error("Error deleting documents: %s", e)
             return None
     
     def get_collections(self, database_name: str = None) -> Optional[List[str]]:
@@ -346,15 +436,15 @@ class MongoDBConnection:
             List of collection names or None if error
         """
         database = self.get_database(database_name)
-        if not database:
+        if database is None:
             return None
         
         try:
             collections = database.list_collection_names()
-            logger.info(f"Found {len(collections)} collections")
+            logger.info("Found %s collections", len(collections))
             return collections
         except PyMongoError as e:
-            logger.error(f"Error getting collections: {e}")
+            logger.error("Error getting collections: %s", e)
             return None
     
     def get_databases(self) -> Optional[List[str]]:
@@ -370,10 +460,10 @@ class MongoDBConnection:
         
         try:
             databases = self.client.list_database_names()
-            logger.info(f"Found {len(databases)} databases")
+            logger.info("Found %s databases", len(databases))
             return databases
         except PyMongoError as e:
-            logger.error(f"Error getting databases: {e}")
+            logger.error("Error getting databases: %s", e)
             return None
     
     def collection_exists(self, collection_name: str, database_name: str = None) -> bool:
@@ -393,31 +483,52 @@ class MongoDBConnection:
         return False
     
     def get_document_count(self, collection_name: str, filter_dict: Dict[str, Any] = None,
-                          database_name: str = None) -> Optional[int]:
+                          database_name: str = None, exact: bool = False) -> Optional[int]:
         """
         Get the number of documents in a collection.
         
+        Without a filter the count comes from collection metadata instead of a scan. That
+        estimate can drift from the true count (e.g. after an unclean shutdown or during
+        chunk migrations on a sharded cluster); pass exact=True to always count documents.
+        
         Args:
             collection_name: Name of the collection
             filter_dict: Filter criteria (optional)
             database_name: Name of the database (uses default if not specified)
+            exact: Count matching documents even when no filter is given
             
         Returns:
             Number of documents or None if error
         """
         collection = self.get_collection(collection_name, database_name)
-        if not collection:
+        if collection is None:
             return None
         
         try:
-            count = collection.count_documents(filter_dict or {})
-            logger.info(f"Collection {collection_name} has {count} documents")
+            if filter_dict or exact:
+                count = collection.count_documents(filter_dict or {})
+            else:
+                count = collection.estimated_document_count()
+            logger.info("Collection %s has %s documents", collection_name, count)
             return count
         except PyMongoError as e:
-            logger.error(f"Error counting documents: {e}")
+            logger.error("Error counting documents: %s", e)
             return None
 
 
+def ids_as_str(ids: List[ObjectId]) -> List[str]:
+    """
+    Convert ObjectIds to their hex string form.
+    
+    Args:
+        ids: ObjectIds, e.g. as returned by insert_many_documents()
+        
+    Returns:
+        List of ObjectId strings
+    """
+    return list(map(str, ids))
+
+
 def create_connection_from_env() -> Optional[MongoDBConnection]:
     """
     Create MongoDB connection using environment variables.
@@ -465,5 +576,5 @@ def test_connection(connection: MongoDBConnection) -> bool:
             return True
         return False
     except Exception as e:
-        logger.error(f"Connection test failed: {e}")
+        logger.error("Connection test failed: %s", e)
         return False
@@ -1,19 +1,85 @@
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, PoolError, pooling
+from collections import OrderedDict
+from contextlib import contextmanager
+import asyncio
+import functools
+import itertools
 import os
-from typing import Optional, List, Dict, Any, Tuple
+import sys
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from db_utils import PoolExhaustedError, PoolGate, ResultCache, safe_ident as _safe_ident
+
 logger = logging.getLogger(__name__)
 
+def _params_key(params) -> Optional[tuple]:
+    """
+    Return query parameters as a hashable cache key.
+    
+    Sequences become tuples and dicts (named placeholders) sorted item tuples.
+    
+    Raises:
+        TypeError: If a parameter value is unhashable
+    """
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        key = tuple(sorted(params.items()))
+    else:
+        key = tuple(params)
+    hash(key)
+    return key
+
+
+# Prepared statements kept open per connection; the least recently used are closed
+PREPARED_CACHE_SIZE = 256
+
+# Pooled connections per process when MYSQL_POOL_SIZE is unset; keep it at least the
+# number of server threads
+DEFAULT_POOL_SIZE = 10
+
+# Pool names must be unique per process
+_pool_ids = itertools.count(1)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_pool(host: str, port: int, database: str, user: str, password: str,
+                 pool_size: int) -> pooling.MySQLConnectionPool:
+    """
+    Return the process-wide connection pool for these connection settings.
+    
+    MySQLConnection instances with the same settings share one pool, so connecting again
+    reuses already authenticated connections instead of opening new ones.
+    """
+    return pooling.MySQLConnectionPool(
+        pool_name=f'dash{next(_pool_ids)}',
+        pool_size=pool_size,
+        host=host,
+        port=port,
+        database=database,
+        user=user,
+        password=password,
+        autocommit=True,
+        # Keep server-side prepared statements alive across checkouts
+        pool_reset_session=False
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_gate(host: str, port: int, database: str, user: str, password: str,
+                 pool_size: int) -> PoolGate:
+    """Return the gate for the pool _shared_pool() returns for the same settings."""
+    return PoolGate(pool_size)
+
 
 class MySQLConnection:
     """MySQL database connection manager with utility methods."""
     
     def __init__(self, host: str = 'localhost', port: int = 3306, 
-                 database: str = None, user: str = None, password: str = None):
+                 database: str = None, user: str = None, password: str = None,
+                 pool_size: int = None, cache_ttl: float = 60, cache_size: int = 512):
         """
         Initialize MySQL connection parameters.
         
@@ -23,13 +89,22 @@ class MySQLConnection:
             database: Database name
             user: MySQL username
             password: MySQL password
+            pool_size: Number of pooled connections (optional). When set, every query
+                checks out its own connection so concurrent callers do not share one socket.
+            cache_ttl: Seconds execute_query() results are reused for (0 disables caching)
+            cache_size: Maximum number of cached query results
         """
         self.host = host
         self.port = port
         self.database = database
         self.user = user
         self.password = password
+        self.pool_size = pool_size
         self.connection = None
+        self.pool = None
+        self._gate = None
+        self._prepared_cursors = {}
+        self._result_cache = ResultCache(cache_ttl, cache_size)
         
     def connect(self) -> bool:
         """
@@ -38,7 +113,23 @@ class MySQLConnection:
         Returns:
             bool: True if connection successful, False otherwise
         """
+        self._prepared_cursors.clear()
         try:
+            if self.pool_size:
+                self.pool = _shared_pool(self.host, self.port, self.database, self.user,
+                                         self.password, self.pool_size)
+                self._gate = _shared_gate(self.host, self.port, self.database, self.user,
+                                          self.password, self.pool_size)
+                
+                # Check out one connection to verify the pool works
+                with self._acquire() as connection:
+                    if connection.is_connected():
+                        logger.info("Successfully connected to MySQL database: %s (pool of %s)",
+                                    self.database, self.pool_size)
+                        return True
+                self.pool = None
+                return False
+            
             self.connection = mysql.connector.connect(
                 host=self.host,
                 port=self.port,
@@ -49,45 +140,294 @@ class MySQLConnection:
             )
             
             if self.connection.is_connected():
-                logger.info(f"Successfully connected to MySQL database: {self.database}")
+                logger.info("Successfully connected to MySQL database: %s", self.database)
                 return True
                 
         except Error as e:
-            logger.error(f"Error connecting to MySQL database: {e}")
+            self.pool = None
+            logger.error("Error connecting to MySQL database: %s", e)
             return False
             
         return False
     
     def disconnect(self):
         """Close the database connection."""
+        self._prepared_cursors.clear()
+        if self.pool:
+            # The pool is shared per process; its connections stay open for the next user
+            self.pool = None
+            self._gate = None
+            logger.info("MySQL connection pool released.")
         if self.connection and self.connection.is_connected():
             self.connection.close()
             logger.info("MySQL connection closed.")
+        self.connection = None
+    
+    def __enter__(self) -> 'MySQLConnection':
+        """Connect on entering a with block."""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Disconnect on leaving a with block, even if it raised."""
+        self.disconnect()
+        return False
     
-    def execute_query(self, query: str, params: tuple = None) -> Optional[List[Tuple]]:
+    def is_connected(self) -> bool:
+        """
+        Check whether connect() has succeeded, without a server round-trip.
+        
+        Returns:
+            bool: True if a pool or connection is available, False otherwise
+        """
+        return self.pool is not None or self.connection is not None
+    
+    def pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Report connection pool usage.
+        
+        Returns:
+            Dictionary with the pool size and the number of connections in use and of
+            callers waiting for one, or None without a pool
+        """
+        if self._gate is None:
+            return None
+        return self._gate.stats()
+    
+    def _ensure_connected(self) -> bool:
+        """Connect (or reconnect a dropped single connection) if needed."""
+        if self.pool:
+            return True
+        if self.connection and self.connection.is_connected():
+            return True
+        return self.connect()
+    
+    @contextmanager
+    def _acquire(self):
+        """
+        Yield a connection for one unit of work.
+        
+        Pooled connections are returned to the pool afterwards; without a pool the
+        shared connection is yielded. When every pooled connection is checked out, this
+        waits for one to be returned, raising PoolError if none is within the gate timeout.
+        """
+        if self.pool:
+            try:
+                with self._gate:
+                    connection = self.pool.get_connection()
+                    try:
+                        yield connection
+                    finally:
+                        connection.close()
+            except PoolExhaustedError as e:
+                # Surface it as the driver's own error so callers' Error handling applies
+                raise PoolError(str(e)) from e
+        else:
+            yield self.connection
+    
+    def _prepared_cursor(self, connection, query: str):
+        """
+        Return a prepared-statement cursor for query on this connection.
+        
+        The statement is prepared on the server the first time it runs on a given
+        connection; the cursor is kept so later executions only send the parameters.
+        Each connection keeps at most PREPARED_CACHE_SIZE statements, closing the least
+        recently used.
+        """
+        # A pooled connection is a fresh wrapper on every checkout, so key on the
+        # underlying connection the statement was prepared on. Only the thread holding
+        # that connection touches its cursors.
+        raw = getattr(connection, '_cnx', connection)
+        cursors = self._prepared_cursors.setdefault(raw, OrderedDict())
+        cursor = cursors.get(query)
+        if cursor is not None:
+            cursors.move_to_end(query)
+            return cursor
+        
+        cursor = connection.cursor(prepared=True)
+        cursors[query] = cursor
+        while len(cursors) > PREPARED_CACHE_SIZE:
+            _, stale = cursors.popitem(last=False)
+            try:
+                stale.close()
+            except Error:
+                pass
+        return cursor
+    
+    def clear_cache(self):
+        """Drop all cached query results (done automatically after every write)."""
+        self._result_cache.clear()
+    
+    def execute_query(self, query: str, params: tuple = None,
+                      prepared: bool = False, use_cache: bool = True) -> Optional[List[Tuple]]:
         """
         Execute a SELECT query and return results.
         
+        Results are reused for identical queries and parameters for cache_ttl seconds,
+        until the next write through this connection.
+        
         Args:
             query: SQL query string
             params: Query parameters (optional)
+            prepared: Run as a server-side prepared statement that is parsed once per
+                connection and reused on later calls (optional)
+            use_cache: Set to False to always read from the database (optional)
             
         Returns:
             List of tuples containing query results, or None if error
         """
-        if not self.connection or not self.connection.is_connected():
-            if not self.connect():
-                return None
+        if use_cache:
+            try:
+                cache_key = (query, _params_key(params))
+            except TypeError:
+                # Unhashable parameter values; run the query uncached
+                use_cache = False
+        if use_cache:
+            results = self._result_cache.get(cache_key)
+            if results is not None:
+                return results
+        
+        if not self._ensure_connected():
+            return None
+        
+        if prepared:
+            # The cursor only skips re-preparing when handed the same string object
+            query = sys.intern(query)
                 
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            cursor.close()
+            with self._acquire() as connection:
+                if prepared:
+                    raw = getattr(connection, '_cnx', connection)
+                    # A cached statement is gone from the server once the connection has
+                    # reconnected (wait_timeout, server restart), so a failure on one is
+                    # retried once with a freshly prepared statement
+                    attempts = 2 if query in self._prepared_cursors.get(raw, {}) else 1
+                    for attempt in range(attempts):
+                        cursor = self._prepared_cursor(connection, query)
+                        try:
+                            cursor.execute(query, params)
+                            results = cursor.fetchall()
+                            break
+                        except Error as e:
+                            # Drop the statement so the next attempt or call prepares it again
+                            self._prepared_cursors.get(raw, {}).pop(query, None)
+                            try:
+                                cursor.close()
+                            except Error:
+                                pass
+                            if attempt == attempts - 1:
+                                raise
+                            logger.warning("Cached prepared statement failed, preparing it again: %s", e)
+                else:
+                    cursor = connection.cursor()
+                    cursor.execute(query, params)
+                    results = cursor.fetchall()
+                    cursor.close()
+            if use_cache:
+                self._result_cache.put(cache_key, results)
             return results
             
         except Error as e:
-            logger.error(f"Error executing query: {e}")
+            logger.error("Error executing query: %s", e)
+            return None
+    
+    def _execute_scalar(self, query: str, params: tuple = None, prepared: bool = False,
+                        use_cache: bool = True) -> Any:
+        """Execute a query returning one value and return it, or None if error or no rows."""
+        results = self.execute_query(query, params, prepared=prepared, use_cache=use_cache)
+        if results:
+            return results[0][0]
+        return None
+    
+    async def aexecute_query(self, query: str, params: tuple = None,
+                             prepared: bool = False) -> Optional[List[Tuple]]:
+        """
+        Execute a SELECT query without blocking the event loop and return results.
+        
+        The query runs on a worker thread, so with a pool (pool_size) several queries
+        awaited together run concurrently, each on its own pooled connection.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            prepared: Run as a server-side prepared statement (see execute_query)
+            
+        Returns:
+            List of tuples containing query results, or None if error
+        """
+        return await asyncio.to_thread(self.execute_query, query, params, prepared)
+    
+    def iter_query(self, query: str, params: tuple = None,
+                   arraysize: int = 10000) -> Iterator[List[Tuple]]:
+        """
+        Execute a SELECT query and yield its results in batches.
+        
+        Rows are read from the server with an unbuffered cursor, arraysize at a time, so
+        only one batch is held in memory instead of the whole result set. The connection
+        stays checked out until the generator is exhausted or closed; without a pool that
+        is the shared connection, so drain or close the generator before running another
+        query through this object.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            arraysize: Number of rows per batch
+            
+        Yields:
+            Lists of up to arraysize row tuples
+            
+        Raises:
+            Error: If the connection or the query fails
+        """
+        if not self._ensure_connected():
+            raise Error("MySQL connection not available")
+        
+        with self._acquire() as connection:
+            cursor = connection.cursor(buffered=False)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(arraysize)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                # Discard rows left unread by a consumer that stopped early, so the
+                # connection can run the next statement
+                connection.consume_results()
+                cursor.close()
+    
+    def read_sql_df(self, query: str, params: tuple = None):
+        """
+        Execute a SELECT query and return the results as a pandas DataFrame.
+        
+        The frame is built straight from the fetched rows with the cursor's column names,
+        so callers do not rebuild it from execute_query() output themselves.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            
+        Returns:
+            pandas.DataFrame with one column per selected column, or None if error
+        """
+        # pandas is only needed by callers that ask for a DataFrame
+        import pandas as pd
+        
+        if not self._ensure_connected():
+            return None
+        
+        try:
+            with self._acquire() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                columns = cursor.column_names
+                cursor.close()
+            return pd.DataFrame.from_records(rows, columns=columns)
+            
+        except Error as e:
+            logger.error("Error executing query: %s", e)
             return None
     
     def execute_update(self, query: str, params: tuple = None) -> bool:
@@ -101,19 +441,23 @@ class MySQLConnection:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.connection or not self.connection.is_connected():
-            if not self.connect():
-                return False
+        if not self._ensure_connected():
+            return False
                 
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            cursor.close()
+            with self._acquire() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params)
+                # Connections run in autocommit mode, so the statement is already
+                # committed; skip the COMMIT round trip unless a transaction is open
+                if connection.in_transaction:
+                    connection.commit()
+                cursor.close()
+            self.clear_cache()
             return True
             
         except Error as e:
-            logger.error(f"Error executing update: {e}")
+            logger.error("Error executing update: %s", e)
             return False
     
     def execute_many(self, query: str, params_list: List[tuple]) -> bool:
@@ -127,19 +471,21 @@ class MySQLConnection:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.connection or not self.connection.is_connected():
-            if not self.connect():
-                return False
+        if not self._ensure_connected():
+            return False
                 
         try:
-            cursor = self.connection.cursor()
-            cursor.executemany(query, params_list)
-            self.connection.commit()
-            cursor.close()
+            with self._acquire() as connection:
+                cursor = connection.cursor()
+                cursor.executemany(query, params_list)
+                if connection.in_transaction:
+                    connection.commit()
+                cursor.close()
+            self.clear_cache()
             return True
             
         except Error as e:
-            logger.error(f"Error executing batch update: {e}")
+            logger.error("Error executing batch update: %s", e)
             return False
     
     def get_table_info(self, table_name: str) -> Optional[List[Dict[str, Any]]]:
@@ -202,29 +548,66 @@ class MySQLConnection:
         WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
         """
         
-        results = self.execute_query(query, (self.database, table_name))
-        if results:
-            return results[0][0] > 0
-        return False
+        count = self._execute_scalar(query, (self.database, table_name), prepared=True)
+        return count is not None and count > 0
     
-    def get_row_count(self, table_name: str) -> Optional[int]:
+    def get_row_count(self, table_name: str, exact: bool = False) -> Optional[int]:
         """
         Get the number of rows in a table.
         
+        By default this reads the row estimate InnoDB keeps in INFORMATION_SCHEMA, a
+        metadata lookup rather than a scan of the whole table. The estimate can be off by
+        a fair margin (it is refreshed when table statistics are), so pass exact=True
+        when the count has to be right.
+        
         Args:
             table_name: Name of the table
+            exact: Run SELECT COUNT(*) instead of reading the estimate (optional)
             
         Returns:
             Number of rows, or None if error
         """
-        query = f"SELECT COUNT(*) FROM {table_name}"
-        results = self.execute_query(query)
-        if results:
-            return results[0][0]
+        if not exact:
+            query = """
+            SELECT TABLE_ROWS 
+            FROM INFORMATION_SCHEMA.TABLES 
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+            """
+            
+            count = self._execute_scalar(query, (self.database, table_name), prepared=True)
+            # Views have no estimate; count those exactly
+            if count is not None:
+                return int(count)
+        
+        query = f"SELECT COUNT(*) FROM {_safe_ident(table_name)}"
+        return self._execute_scalar(query, prepared=True, use_cache=not exact)
+
+
+@functools.lru_cache(maxsize=1)
+def _mysql_env() -> Optional[Dict[str, Any]]:
+    """
+    Read the MySQLConnection settings from the environment once per process.
+    
+    Returns:
+        Keyword arguments for MySQLConnection, or None if required variables are missing
+    """
+    database = os.getenv('MYSQL_DATABASE')
+    user = os.getenv('MYSQL_USER')
+    password = os.getenv('MYSQL_PASSWORD')
+    if not all([database, user, password]):
         return None
+    
+    return {
+        'host': os.getenv('MYSQL_HOST', 'localhost'),
+        'port': int(os.getenv('MYSQL_PORT', '3306')),
+        'database': database,
+        'user': user,
+        'password': password,
+        'pool_size': int(os.getenv('MYSQL_POOL_SIZE', DEFAULT_POOL_SIZE)),
+    }
 
 
-def create_connection_from_env() -> Optional[MySQLConnection]:
+def create_connection_from_env(pool_size: int = None) -> Optional[MySQLConnection]:
     """
     Create MySQL connection using environment variables.
     
@@ -234,21 +617,26 @@ def create_connection_from_env() -> Optional[MySQLConnection]:
     - MYSQL_DATABASE
     - MYSQL_USER
     - MYSQL_PASSWORD
+    - MYSQL_POOL_SIZE (optional, default 10)
+    
+    The variables are read on the first call; call _mysql_env.cache_clear() after
+    changing them.
+    
+    Args:
+        pool_size: Number of pooled connections (optional, MYSQL_POOL_SIZE otherwise;
+            0 for a single unpooled connection)
     
     Returns:
         MySQLConnection object or None if environment variables are missing
     """
-    host = os.getenv('MYSQL_HOST', 'localhost')
-    port = int(os.getenv('MYSQL_PORT', '3306'))
-    database = os.getenv('MYSQL_DATABASE')
-    user = os.getenv('MYSQL_USER')
-    password = os.getenv('MYSQL_PASSWORD')
-    
-    if not all([database, user, password]):
+    config = _mysql_env()
+    if config is None:
         logger.error("Missing required environment variables for MySQL connection")
         return None
     
-    return MySQLConnection(host, port, database, user, password)
+    if pool_size is not None:
+        config = {**config, 'pool_size': pool_size}
+    return MySQLConnection(**config)
 
 
 def test_connection(connection: MySQLConnection) -> bool:
@@ -269,5 +657,5 @@ def test_connection(connection: MySQLConnection) -> bool:
             return result is not None and len(result) > 0
         return False
     except Exception as e:
-        logger.error(f"Connection test failed: {e}")
+        logger.error("Connection test failed: %s", e)
         return False
@@ -1,22 +1,104 @@
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, AsyncGraphDatabase, Driver, Result, RoutingControl, READ_ACCESS
 from neo4j.exceptions import ServiceUnavailable, AuthError, ClientError
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import functools
 import os
-from typing import Optional, List, Dict, Any, Tuple, Union
+import threading
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterator
 import logging
 from datetime import datetime
 import json
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from db_utils import PoolGate, ResultCache, safe_ident as _safe_ident
+
 logger = logging.getLogger(__name__)
 
 
+def _label_pattern(labels: Optional[List[str]]) -> str:
+    """Return ':`A`:`B`' for labels, or '' for none."""
+    return _label_fragment(tuple(labels or ()))
+
+
+# Query fragments are rebuilt from the same few labels and property names on every
+# call, so they are built once per distinct key
+@functools.lru_cache(maxsize=1024)
+def _label_fragment(labels: Tuple[str, ...]) -> str:
+    return ''.join(':' + _safe_ident(label) for label in labels)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_fragment(names: Tuple[str, ...]) -> str:
+    """Return 'n.`a` = $p0 AND n.`b` = $p1' for the (sorted) property names."""
+    return ' AND '.join(f"n.{_safe_ident(k)} = $p{i}" for i, k in enumerate(names))
+
+
+# Process-wide drivers keyed by connection settings, closed by Neo4jConnection.shutdown_all()
+_DRIVER_REGISTRY: Dict[Tuple[str, str, str, Optional[int], Optional[float], Optional[float]], Driver] = {}
+_GATE_REGISTRY: Dict[Tuple[str, str, str, Optional[int]], PoolGate] = {}
+_DRIVER_REGISTRY_LOCK = threading.Lock()
+
+# The driver's max_connection_pool_size when none is given
+DEFAULT_POOL_SIZE = 100
+
+# Seconds the driver keeps retrying a failed query (its default is 30); queries hold a
+# pool slot meanwhile, so an unreachable server has to fail fast
+MAX_TRANSACTION_RETRY_TIME = 5
+
+
+def _driver_config(pool_size: int = None, connection_timeout: float = None,
+                   max_connection_lifetime: float = None) -> Dict[str, Any]:
+    """Return the driver keyword arguments for the settings that are given."""
+    config = {}
+    if pool_size:
+        config['max_connection_pool_size'] = pool_size
+    if connection_timeout is not None:
+        config['connection_timeout'] = connection_timeout
+    if max_connection_lifetime is not None:
+        config['max_connection_lifetime'] = max_connection_lifetime
+    return config
+
+
+def _shared_driver(uri: str, username: str, password: str, pool_size: int = None,
+                   connection_timeout: float = None,
+                   max_connection_lifetime: float = None) -> Driver:
+    """
+    Return the process-wide driver for these connection settings.
+    
+    The driver keeps a pool of Bolt connections, so Neo4jConnection instances with the
+    same settings share one driver instead of each opening its own pool.
+    """
+    key = (uri, username, password, pool_size, connection_timeout, max_connection_lifetime)
+    with _DRIVER_REGISTRY_LOCK:
+        driver = _DRIVER_REGISTRY.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(
+                uri, auth=(username, password), keep_alive=True,
+                max_transaction_retry_time=MAX_TRANSACTION_RETRY_TIME,
+                **_driver_config(pool_size, connection_timeout, max_connection_lifetime)
+            )
+            _DRIVER_REGISTRY[key] = driver
+        return driver
+
+
+def _shared_gate(uri: str, username: str, password: str, pool_size: int = None) -> PoolGate:
+    """Return the gate for the driver _shared_driver() returns for the same settings."""
+    key = (uri, username, password, pool_size)
+    with _DRIVER_REGISTRY_LOCK:
+        gate = _GATE_REGISTRY.get(key)
+        if gate is None:
+            gate = _GATE_REGISTRY[key] = PoolGate(pool_size or DEFAULT_POOL_SIZE)
+        return gate
+
+
 class Neo4jConnection:
     """Neo4j database connection manager with utility methods."""
     
     def __init__(self, uri: str = 'bolt://localhost:7687', 
                  username: str = 'neo4j', password: str = 'password',
-                 database: str = 'neo4j'):
+                 database: str = 'neo4j', pool_size: int = None,
+                 cache_ttl: float = 60, cache_size: int = 512,
+                 connection_timeout: float = None, max_connection_lifetime: float = None):
         """
         Initialize Neo4j connection parameters.
         
@@ -25,12 +107,26 @@ class Neo4jConnection:
             username: Neo4j username
             password: Neo4j password
             database: Database name (default: neo4j)
+            pool_size: Maximum number of pooled Bolt connections (optional, driver
+                default otherwise)
+            cache_ttl: Seconds read query results are reused for (0 disables caching)
+            cache_size: Maximum number of cached query results
+            connection_timeout: Seconds to wait when opening a Bolt connection (optional,
+                driver default otherwise)
+            max_connection_lifetime: Seconds after which pooled connections are replaced
+                (optional, driver default otherwise)
         """
         self.uri = uri
         self.username = username
         self.password = password
         self.database = database
+        self.pool_size = pool_size
+        self.connection_timeout = connection_timeout
+        self.max_connection_lifetime = max_connection_lifetime
         self.driver = None
+        self._gate = None
+        self._async_driver = None
+        self._result_cache = ResultCache(cache_ttl, cache_size)
         
     def connect(self) -> bool:
         """
@@ -40,56 +136,268 @@ class Neo4jConnection:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.driver = GraphDatabase.driver(
-                self.uri, 
-                auth=(self.username, self.password)
-            )
+            self._gate = _shared_gate(self.uri, self.username, self.password, self.pool_size)
+            self.driver = _shared_driver(self.uri, self.username, self.password, self.pool_size,
+                                         self.connection_timeout, self.max_connection_lifetime)
             
-            # Test the connection
-            with self.driver.session(database=self.database) as session:
-                result = session.run("RETURN 1 as test")
-                result.single()
+            # Test the connection (a single attempt, unlike the retried execute_query)
+            self.driver.verify_connectivity()
             
-            logger.info(f"Successfully connected to Neo4j at {self.uri}")
+            logger.info("Successfully connected to Neo4j at %s", self.uri)
             return True
             
         except (ServiceUnavailable, AuthError) as e:
-            logger.error(f"Error connecting to Neo4j: {e}")
-            return False
+            logger.error("Error connecting to Neo4j: %s", e)
         except Exception as e:
-            logger.error(f"Unexpected error connecting to Neo4j: {e}")
-            return False
+            logger.error("Unexpected error connecting to Neo4j: %s", e)
+        
+        # Leave the connection unusable, so callers see Neo4j as down and reconnect
+        self.driver = None
+        self._gate = None
+        return False
     
     def disconnect(self):
-        """Close the database connection."""
+        """Release the database connection."""
         if self.driver:
-            self.driver.close()
-            logger.info("Neo4j connection closed.")
+            # The driver is shared per process; its pool stays open for other connections
+            self.driver = None
+            self._gate = None
+            logger.info("Neo4j connection released.")
+    
+    @staticmethod
+    def shutdown_all():
+        """Close every shared driver and its connection pool (runs at interpreter exit)."""
+        with _DRIVER_REGISTRY_LOCK:
+            drivers = list(_DRIVER_REGISTRY.values())
+            _DRIVER_REGISTRY.clear()
+            _GATE_REGISTRY.clear()
+        for driver in drivers:
+            try:
+                driver.close()
+            except Exception as e:
+                logger.error("Error closing Neo4j driver: %s", e)
+    
+    def __enter__(self) -> 'Neo4jConnection':
+        """Connect on entering a with block."""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Disconnect on leaving a with block, even if it raised."""
+        self.disconnect()
+        return False
     
-    def execute_query(self, query: str, parameters: Dict[str, Any] = None) -> Optional[List[Dict[str, Any]]]:
+    def pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Report connection pool usage.
+        
+        Returns:
+            Dictionary with the pool size and the number of queries running and of
+            callers waiting for a connection, or None when not connected
+        """
+        if self._gate is None:
+            return None
+        return self._gate.stats()
+    
+    def clear_cache(self):
+        """Drop all cached query results (done automatically after every write)."""
+        self._result_cache.clear()
+    
+    def execute_query(self, query: str, parameters: Dict[str, Any] = None,
+                      read_only: bool = False, use_cache: bool = True) -> Optional[List[Dict[str, Any]]]:
         """
         Execute a Cypher query and return results.
         
+        The query runs in a driver-managed transaction on a pooled connection, routed to
+        the writer, so queries that create or change data are safe by default. Queries
+        marked read_only may be routed to any cluster member, and their results are
+        reused for identical queries and parameters for cache_ttl seconds, until the
+        next write through this connection.
+        
         Args:
             query: Cypher query string
             parameters: Query parameters (optional)
+            read_only: The query only reads data, so it may go to a reader and be cached
+            use_cache: Set to False to always read from the database (read_only only)
             
         Returns:
             List of dictionaries containing query results or None if error
         """
+        write = not read_only
+        use_cache = use_cache and read_only
+        if use_cache:
+            cache_key = (query, json.dumps(parameters or {}, sort_keys=True, default=str))
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                # Records are cached as item tuples, so each caller gets its own dicts
+                return [dict(items) for items in cached]
+        
+        if not self.driver:
+            if not self.connect():
+                return None
+        
+        try:
+            with self._gate:
+                result = self.driver.execute_query(
+                    query, parameters or {},
+                    database_=self.database,
+                    routing_=RoutingControl.WRITE if write else RoutingControl.READ
+                )
+            records = [dict(record) for record in result.records]
+            logger.info("Query executed successfully, returned %s records", len(records))
+            if write:
+                self.clear_cache()
+            elif use_cache:
+                self._result_cache.put(cache_key, [tuple(record.items()) for record in records])
+            return records
+        except Exception as e:
+            logger.error("Error executing query: %s", e)
+            return None
+    
+    def execute_query_columnar(self, query: str, parameters: Dict[str, Any] = None,
+                               use_cache: bool = True) -> Optional[Tuple[List[str], List[Tuple]]]:
+        """
+        Execute a read Cypher query and return its column names and value tuples.
+        
+        Every row is a plain tuple instead of a dict repeating the column names, which
+        saves memory on large results and can go straight into
+        pandas.DataFrame(rows, columns=keys). Cached like a read_only execute_query().
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (optional)
+            use_cache: Set to False to always read from the database (optional)
+            
+        Returns:
+            (keys, rows) tuple, or None if error
+        """
+        if use_cache:
+            cache_key = ('columnar', query, json.dumps(parameters or {}, sort_keys=True, default=str))
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                keys, rows = cached
+                return list(keys), list(rows)
+        
         if not self.driver:
             if not self.connect():
                 return None
         
         try:
-            with self.driver.session(database=self.database) as session:
-                result = session.run(query, parameters or {})
-                records = [dict(record) for record in result]
-                logger.info(f"Query executed successfully, returned {len(records)} records")
-                return records
+            with self._gate:
+                records, _, keys = self.driver.execute_query(
+                    query, parameters or {},
+                    database_=self.database,
+                    routing_=RoutingControl.READ
+                )
+            rows = [tuple(record.values()) for record in records]
+            logger.info("Query executed successfully, returned %s records", len(rows))
         except Exception as e:
-            logger.error(f"Error executing query: {e}")
+            logger.error("Error executing query: %s", e)
             return None
+        
+        if use_cache:
+            self._result_cache.put(cache_key, (tuple(keys), tuple(rows)))
+        return keys, rows
+    
+    def _execute_scalar(self, query: str, parameters: Dict[str, Any] = None) -> Any:
+        """
+        Execute a read query returning one value and return it, or None if error.
+        
+        Reads the single value straight off the result instead of building a dict per
+        record, and caches it under a plain tuple key.
+        """
+        parameters = parameters or {}
+        cache_key = (query, tuple(sorted(parameters.items())))
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached[0]
+        
+        if not self.driver:
+            if not self.connect():
+                return None
+        
+        try:
+            with self._gate:
+                value = self.driver.execute_query(
+                    query, parameters,
+                    database_=self.database,
+                    routing_=RoutingControl.READ,
+                    result_transformer_=Result.single
+                )[0]
+        except Exception as e:
+            logger.error("Error executing query: %s", e)
+            return None
+        
+        self._result_cache.put(cache_key, (value,))
+        return value
+    
+    def iter_query(self, query: str, parameters: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a read Cypher query and yield its records one at a time.
+        
+        Records are converted as they arrive instead of after the whole result has been
+        received, so memory stays flat for large results. The session stays open until
+        the generator is exhausted or closed. Results are not cached.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (optional)
+            
+        Yields:
+            Dictionaries containing one record each
+            
+        Raises:
+            ServiceUnavailable: If no connection can be made
+            PoolExhaustedError: If no pooled connection frees up within the gate timeout
+            Neo4jError: If the query fails
+        """
+        if not self.driver:
+            if not self.connect():
+                raise ServiceUnavailable("Neo4j connection not available")
+        
+        with self._gate, self.driver.session(database=self.database,
+                                             default_access_mode=READ_ACCESS) as session:
+            for record in session.run(query, parameters or {}):
+                yield dict(record)
+    
+    async def aexecute_query(self, query: str,
+                             parameters: Dict[str, Any] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute a Cypher query without blocking the event loop and return results.
+        
+        Uses an async driver created on first use (async drivers belong to the event loop
+        that uses them), so many queries can be in flight at once on its connection pool.
+        Call aclose() before the event loop ends.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (optional)
+            
+        Returns:
+            List of dictionaries containing query results or None if error
+        """
+        try:
+            if self._async_driver is None:
+                self._async_driver = AsyncGraphDatabase.driver(
+                    self.uri, auth=(self.username, self.password),
+                    **_driver_config(self.pool_size, self.connection_timeout,
+                                     self.max_connection_lifetime)
+                )
+            
+            async with self._async_driver.session(database=self.database) as session:
+                result = await session.run(query, parameters or {})
+                records = [dict(record) async for record in result]
+            logger.info("Query executed successfully, returned %s records", len(records))
+            return records
+        except Exception as e:
+            logger.error("Error executing query: %s", e)
+            return None
+    
+    async def aclose(self):
+        """Close the async driver used by aexecute_query()."""
+        if self._async_driver is not None:
+            await self._async_driver.close()
+            self._async_driver = None
     
     def execute_write_query(self, query: str, parameters: Dict[str, Any] = None) -> bool:
         """
@@ -107,14 +415,14 @@ class Neo4jConnection:
                 return False
         
         try:
-            with self.driver.session(database=self.database) as session:
-                with session.begin_transaction() as tx:
-                    result = tx.run(query, parameters or {})
-                    tx.commit()
-                logger.info("Write query executed successfully")
-                return True
+            with self._gate:
+                self.driver.execute_query(query, parameters or {}, database_=self.database,
+                                          routing_=RoutingControl.WRITE)
+            logger.info("Write query executed successfully")
+            self.clear_cache()
+            return True
         except Exception as e:
-            logger.error(f"Error executing write query: {e}")
+            logger.error("Error executing write query: %s", e)
             return False
     
     def create_node(self, labels: List[str], properties: Dict[str, Any]) -> Optional[str]:
@@ -128,14 +436,57 @@ class Neo4jConnection:
         Returns:
             Node ID as string or None if error
         """
-        labels_str = ':'.join(labels) if labels else ''
-        properties_str = ', '.join([f"{k}: ${k}" for k in properties.keys()])
+        node_id = self._create_node_fast(labels, properties)
+        if node_id is not None:
+            return str(node_id)
+        return None
+    
+    def _create_node_fast(self, labels: List[str], properties: Dict[str, Any]) -> Optional[int]:
+        """
+        Create one node and return its ID, or None if error.
+        
+        Reads the ID straight off the single result record instead of building a list of
+        dicts, which adds up when a loader creates nodes one at a time.
+        """
+        if not self.driver:
+            if not self.connect():
+                return None
         
-        query = f"CREATE (n:{labels_str} {{{properties_str}}}) RETURN id(n) as node_id"
+        query = f"CREATE (n{_label_pattern(labels)}) SET n = $properties RETURN id(n)"
         
-        result = self.execute_query(query, properties)
-        if result and len(result) > 0:
-            return str(result[0]['node_id'])
+        try:
+            with self._gate:
+                node_id = self.driver.execute_query(
+                    query, {'properties': properties or {}},
+                    database_=self.database,
+                    routing_=RoutingControl.WRITE,
+                    result_transformer_=Result.single
+                )[0]
+        except Exception as e:
+            logger.error("Error creating node: %s", e)
+            return None
+        
+        self.clear_cache()
+        return node_id
+    
+    def create_nodes(self, labels: List[str], rows: List[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Create one node per properties dictionary in a single query.
+        
+        Args:
+            labels: List of labels for every node
+            rows: Properties of each node
+            
+        Returns:
+            List of node IDs in the order of rows, or None if error
+        """
+        labels_str = _label_pattern(labels)
+        
+        query = f"UNWIND $rows AS row CREATE (n{labels_str}) SET n = row RETURN id(n) as node_id"
+        
+        result = self.execute_query(query, {'rows': rows})
+        if result is not None:
+            return [record['node_id'] for record in result]
         return None
     
     def create_relationship(self, from_node_id: str, to_node_id: str, 
@@ -152,29 +503,49 @@ class Neo4jConnection:
         Returns:
             bool: True if successful, False otherwise
         """
-        properties = properties or {}
-        properties_str = ', '.join([f"{k}: ${k}" for k in properties.keys()]) if properties else ''
+        # Properties go in as one map parameter, so the query text (and its cached plan)
+        # only depends on the relationship type. Each endpoint is its own MATCH, so both
+        # are id seeks rather than a cartesian product filtered afterwards.
+        query = f"""
+        MATCH (a) WHERE id(a) = $from_id
+        MATCH (b) WHERE id(b) = $to_id
+        CREATE (a)-[r:{_safe_ident(relationship_type)}]->(b) 
+        SET r = $properties
+        """
         
-        if properties_str:
-            query = f"""
-            MATCH (a), (b) 
-            WHERE id(a) = $from_id AND id(b) = $to_id 
-            CREATE (a)-[r:{relationship_type} {{{properties_str}}}]->(b) 
-            RETURN r
-            """
-        else:
-            query = f"""
-            MATCH (a), (b) 
-            WHERE id(a) = $from_id AND id(b) = $to_id 
-            CREATE (a)-[r:{relationship_type}]->(b) 
-            RETURN r
-            """
-        
-        parameters = {'from_id': int(from_node_id), 'to_id': int(to_node_id), **properties}
+        parameters = {'from_id': int(from_node_id), 'to_id': int(to_node_id),
+                      'properties': properties or {}}
+        return self.execute_write_query(query, parameters)
+    
+    def create_relationships(self, pairs: List[Tuple[Union[int, str], Union[int, str], Dict[str, Any]]],
+                             relationship_type: str) -> bool:
+        """
+        Create many relationships of one type in a single query.
+        
+        Args:
+            pairs: (from_node_id, to_node_id, properties) tuples; properties may be None
+            relationship_type: Type of relationship
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        query = f"""
+        UNWIND $pairs AS pair
+        MATCH (a) WHERE id(a) = pair.from_id
+        MATCH (b) WHERE id(b) = pair.to_id
+        CREATE (a)-[r:{_safe_ident(relationship_type)}]->(b)
+        SET r = pair.properties
+        """
+        
+        parameters = {'pairs': [
+            {'from_id': int(from_id), 'to_id': int(to_id), 'properties': properties or {}}
+            for from_id, to_id, properties in pairs
+        ]}
         return self.execute_write_query(query, parameters)
     
     def find_nodes(self, labels: List[str] = None, properties: Dict[str, Any] = None, 
-                  limit: int = 0) -> Optional[List[Dict[str, Any]]]:
+                  limit: int = 0,
+                  stream: bool = False) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]], None]:
         """
         Find nodes with specified labels and properties.
         
@@ -182,21 +553,31 @@ class Neo4jConnection:
             labels: List of labels to filter by (optional)
             properties: Properties to filter by (optional)
             limit: Maximum number of nodes to return
+            stream: Return a generator over the nodes (see iter_query) instead of a list
             
         Returns:
-            List of node dictionaries or None if error
+            List of node dictionaries or None if error; a generator when stream is set
         """
-        labels_str = ':'.join(labels) if labels else 'n'
-        properties_str = ' AND '.join([f"n.{k} = ${k}" for k in properties.keys()]) if properties else ''
+        # Labels stay in the query text so the planner can use label scans and indexes;
+        # everything else is a parameter, with property names sorted, so calls with the
+        # same labels and property names share one cached plan
+        labels_str = _label_pattern(labels)
+        names = tuple(sorted(properties or {}))
+        properties_str = _match_fragment(names)
         
-        query = f"MATCH (n:{labels_str})"
+        query = f"MATCH (n{labels_str})"
         if properties_str:
             query += f" WHERE {properties_str}"
         query += " RETURN n"
+        parameters = {f"p{i}": properties[k] for i, k in enumerate(names)}
         if limit > 0:
-            query += f" LIMIT {limit}"
+            query += " LIMIT $limit"
+            parameters['limit'] = limit
         
-        result = self.execute_query(query, properties or {})
+        if stream:
+            return (dict(record['n']) for record in self.iter_query(query, parameters))
+        
+        result = self.execute_query(query, parameters, read_only=True)
         if result:
             return [dict(record['n']) for record in result]
         return None
@@ -212,7 +593,7 @@ class Neo4jConnection:
             Node dictionary or None if not found
         """
         query = "MATCH (n) WHERE id(n) = $node_id RETURN n"
-        result = self.execute_query(query, {'node_id': int(node_id)})
+        result = self.execute_query(query, {'node_id': int(node_id)}, read_only=True)
         if result and len(result) > 0:
             return dict(result[0]['n'])
         return None
@@ -228,13 +609,34 @@ class Neo4jConnection:
         Returns:
             bool: True if successful, False otherwise
         """
-        properties_str = ', '.join([f"n.{k} = ${k}" for k in properties.keys()])
-        query = f"MATCH (n) WHERE id(n) = $node_id SET {properties_str} RETURN n"
+        # One query text for every property set, merged in as a map parameter
+        query = "MATCH (n) WHERE id(n) = $node_id SET n += $properties RETURN n"
         
-        parameters = {'node_id': int(node_id), **properties}
+        parameters = {'node_id': int(node_id), 'properties': properties}
         result = self.execute_query(query, parameters)
         return result is not None and len(result) > 0
     
+    def update_nodes(self, updates: List[Tuple[Union[int, str], Dict[str, Any]]]) -> bool:
+        """
+        Update the properties of many nodes in a single query.
+        
+        Args:
+            updates: (node_id, properties) tuples; properties are merged into the node
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        query = """
+        UNWIND $updates AS u
+        MATCH (n) WHERE id(n) = u.id
+        SET n += u.props
+        """
+        
+        parameters = {'updates': [
+            {'id': int(node_id), 'props': properties} for node_id, properties in updates
+        ]}
+        return self.execute_write_query(query, parameters)
+    
     def delete_node(self, node_id: str) -> bool:
         """
         Delete a node and its relationships.
@@ -249,7 +651,8 @@ class Neo4jConnection:
         return self.execute_write_query(query, {'node_id': int(node_id)})
     
     def find_relationships(self, from_node_id: str = None, to_node_id: str = None,
-                         relationship_type: str = None) -> Optional[List[Dict[str, Any]]]:
+                         relationship_type: str = None,
+                         stream: bool = False) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]], None]:
         """
         Find relationships between nodes.
         
@@ -257,41 +660,48 @@ class Neo4jConnection:
             from_node_id: Source node ID (optional)
             to_node_id: Target node ID (optional)
             relationship_type: Type of relationship (optional)
+            stream: Return a generator over the relationships (see iter_query) instead
+                of a list
             
         Returns:
-            List of relationship dictionaries or None if error
+            List of relationship dictionaries or None if error; a generator when stream
+            is set
         """
-        query = "MATCH (a)-[r]->(b)"
-        conditions = []
+        # Known endpoints are looked up by id first, then only their relationships expanded
+        clauses = []
         parameters = {}
         
         if from_node_id:
-            conditions.append("id(a) = $from_id")
+            clauses.append("MATCH (a) WHERE id(a) = $from_id")
             parameters['from_id'] = int(from_node_id)
         
         if to_node_id:
-            conditions.append("id(b) = $to_id")
+            clauses.append("MATCH (b) WHERE id(b) = $to_id")
             parameters['to_id'] = int(to_node_id)
         
+        clauses.append("MATCH (a)-[r]->(b)")
         if relationship_type:
-            conditions.append(f"type(r) = '{relationship_type}'")
+            clauses.append("WHERE type(r) = $relationship_type")
+            parameters['relationship_type'] = relationship_type
         
-        if conditions:
-            query += f" WHERE {' AND '.join(conditions)}"
+        query = ' '.join(clauses) + " RETURN a, r, b"
         
-        query += " RETURN a, r, b"
+        if stream:
+            records = self.iter_query(query, parameters)
+        else:
+            records = self.execute_query(query, parameters, read_only=True)
+            if not records:
+                return None
         
-        result = self.execute_query(query, parameters)
-        if result:
-            return [
-                {
-                    'from_node': dict(record['a']),
-                    'relationship': dict(record['r']),
-                    'to_node': dict(record['b'])
-                }
-                for record in result
-            ]
-        return None
+        relationships = (
+            {
+                'from_node': dict(record['a']),
+                'relationship': dict(record['r']),
+                'to_node': dict(record['b'])
+            }
+            for record in records
+        )
+        return relationships if stream else list(relationships)
     
     def get_node_count(self, labels: List[str] = None) -> Optional[int]:
         """
@@ -303,13 +713,9 @@ class Neo4jConnection:
         Returns:
             Number of nodes or None if error
         """
-        labels_str = ':'.join(labels) if labels else 'n'
-        query = f"MATCH (n:{labels_str}) RETURN count(n) as count"
-        
-        result = self.execute_query(query)
-        if result and len(result) > 0:
-            return result[0]['count']
-        return None
+        labels_str = _label_pattern(labels)
+        query = f"MATCH (n{labels_str}) RETURN count(n) as count"
+        return self._execute_scalar(query)
     
     def get_relationship_count(self, relationship_type: str = None) -> Optional[int]:
         """
@@ -322,14 +728,11 @@ class Neo4jConnection:
             Number of relationships or None if error
         """
         if relationship_type:
-            query = f"MATCH ()-[r:{relationship_type}]->() RETURN count(r) as count"
+            query = f"MATCH ()-[r:{_safe_ident(relationship_type)}]->() RETURN count(r) as count"
         else:
             query = "MATCH ()-[r]->() RETURN count(r) as count"
         
-        result = self.execute_query(query)
-        if result and len(result) > 0:
-            return result[0]['count']
-        return None
+        return self._execute_scalar(query)
     
     def get_labels(self) -> Optional[List[str]]:
         """
@@ -339,7 +742,7 @@ class Neo4jConnection:
             List of label names or None if error
         """
         query = "CALL db.labels() YIELD label RETURN label"
-        result = self.execute_query(query)
+        result = self.execute_query(query, read_only=True)
         if result:
             return [record['label'] for record in result]
         return None
@@ -352,7 +755,7 @@ class Neo4jConnection:
             List of relationship type names or None if error
         """
         query = "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
-        result = self.execute_query(query)
+        result = self.execute_query(query, read_only=True)
         if result:
             return [record['relationshipType'] for record in result]
         return None
@@ -368,7 +771,7 @@ class Neo4jConnection:
         Returns:
             bool: True if successful, False otherwise
         """
-        query = f"CREATE INDEX FOR (n:{label}) ON (n.{property_name})"
+        query = f"CREATE INDEX FOR (n:{_safe_ident(label)}) ON (n.{_safe_ident(property_name)})"
         return self.execute_write_query(query)
     
     def create_constraint(self, label: str, property_name: str, constraint_type: str = "UNIQUE") -> bool:
@@ -383,12 +786,14 @@ class Neo4jConnection:
         Returns:
             bool: True if successful, False otherwise
         """
+        label = _safe_ident(label)
+        property_name = _safe_ident(property_name)
         if constraint_type.upper() == "UNIQUE":
             query = f"CREATE CONSTRAINT FOR (n:{label}) REQUIRE n.{property_name} IS UNIQUE"
         elif constraint_type.upper() == "EXISTS":
             query = f"CREATE CONSTRAINT FOR (n:{label}) REQUIRE n.{property_name} IS NOT NULL"
         else:
-            logger.error(f"Unsupported constraint type: {constraint_type}")
+            logger.error("Unsupported constraint type: %s", constraint_type)
             return False
         
         return self.execute_write_query(query)
@@ -410,32 +815,75 @@ class Neo4jConnection:
         Returns:
             Dictionary with database info or None if error
         """
-        info = {}
-        
-        # Get node count
-        node_count = self.get_node_count()
-        if node_count is not None:
-            info['node_count'] = node_count
-        
-        # Get relationship count
-        rel_count = self.get_relationship_count()
-        if rel_count is not None:
-            info['relationship_count'] = rel_count
-        
-        # Get labels
-        labels = self.get_labels()
-        if labels is not None:
-            info['labels'] = labels
-        
-        # Get relationship types
-        rel_types = self.get_relationship_types()
-        if rel_types is not None:
-            info['relationship_types'] = rel_types
-        
+        # Node count, relationship count, labels and relationship types in one round-trip;
+        # each uncorrelated CALL subquery aggregates to exactly one row
+        query = """
+        CALL {
+            MATCH (n) RETURN count(n) AS node_count
+        }
+        CALL {
+            MATCH ()-[r]->() RETURN count(r) AS relationship_count
+        }
+        CALL {
+            CALL db.labels() YIELD label RETURN collect(label) AS labels
+        }
+        CALL {
+            CALL db.relationshipTypes() YIELD relationshipType
+            RETURN collect(relationshipType) AS relationship_types
+        }
+        RETURN node_count, relationship_count, labels, relationship_types
+        """
+        
+        result = self.execute_query(query, read_only=True)
+        if result:
+            return result[0]
+        
+        # Servers that cannot run the combined query (e.g. without CALL subquery support)
+        # get the four lookups as separate queries, run concurrently on pooled sessions
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'node_count': executor.submit(self.get_node_count),
+                'relationship_count': executor.submit(self.get_relationship_count),
+                'labels': executor.submit(self.get_labels),
+                'relationship_types': executor.submit(self.get_relationship_types),
+            }
+            info = {key: future.result() for key, future in futures.items()}
+        
+        info = {key: value for key, value in info.items() if value is not None}
         return info if info else None
 
 
-def create_connection_from_env() -> Optional[Neo4jConnection]:
+atexit.register(Neo4jConnection.shutdown_all)
+
+
+@functools.lru_cache(maxsize=1)
+def _neo4j_env() -> Optional[Dict[str, Any]]:
+    """
+    Read the Neo4jConnection settings from the environment once per process.
+    
+    Returns:
+        Keyword arguments for Neo4jConnection, or None if required variables are missing
+    """
+    username = os.getenv('NEO4J_USERNAME')
+    password = os.getenv('NEO4J_PASSWORD')
+    if not username or not password:
+        return None
+    
+    pool_size = os.getenv('NEO4J_POOL_SIZE')
+    connection_timeout = os.getenv('NEO4J_CONN_TIMEOUT')
+    max_connection_lifetime = os.getenv('NEO4J_MAX_LIFETIME')
+    return {
+        'uri': os.getenv('NEO4J_URI', 'bolt://localhost:7687'),
+        'username': username,
+        'password': password,
+        'database': os.getenv('NEO4J_DATABASE', 'neo4j'),
+        'pool_size': int(pool_size) if pool_size else None,
+        'connection_timeout': float(connection_timeout) if connection_timeout else None,
+        'max_connection_lifetime': float(max_connection_lifetime) if max_connection_lifetime else None,
+    }
+
+
+def create_connection_from_env(pool_size: int = None) -> Optional[Neo4jConnection]:
     """
     Create Neo4j connection using environment variables.
     
@@ -444,20 +892,28 @@ def create_connection_from_env() -> Optional[Neo4jConnection]:
     - NEO4J_USERNAME
     - NEO4J_PASSWORD
     - NEO4J_DATABASE (optional)
+    - NEO4J_POOL_SIZE (optional, driver default 100)
+    - NEO4J_CONN_TIMEOUT (optional, seconds)
+    - NEO4J_MAX_LIFETIME (optional, seconds)
+    
+    The variables are read on the first call; call _neo4j_env.cache_clear() after
+    changing them.
+    
+    Args:
+        pool_size: Maximum number of pooled Bolt connections (optional, NEO4J_POOL_SIZE
+            otherwise)
     
     Returns:
         Neo4jConnection object or None if environment variables are missing
     """
-    uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
-    username = os.getenv('NEO4J_USERNAME')
-    password = os.getenv('NEO4J_PASSWORD')
-    database = os.getenv('NEO4J_DATABASE', 'neo4j')
-    
-    if not username or not password:
+    config = _neo4j_env()
+    if config is None:
         logger.error("Missing required environment variables for Neo4j connection")
         return None
     
-    return Neo4jConnection(uri, username, password, database)
+    if pool_size is not None:
+        config = {**config, 'pool_size': pool_size}
+    return Neo4jConnection(**config)
 
 
 def test_connection(connection: Neo4jConnection) -> bool:
@@ -478,5 +934,5 @@ def test_connection(connection: Neo4jConnection) -> bool:
             return result is not None and len(result) > 0
         return False
     except Exception as e:
-        logger.error(f"Connection test failed: {e}")
+        logger.error("Connection test failed: %s", e)
         return False
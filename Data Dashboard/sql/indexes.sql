@@ -0,0 +1,22 @@
+-- One-time index migrations for the academicworld MySQL database used by the dashboard.
+-- Run once against the database, e.g.:  mysql -u root -p academicworld < sql/indexes.sql
+
+-- Full-text index backing the keyword search (Widget 1) and keyword comparison (Widget 2).
+-- MATCH(...) AGAINST(...) must name exactly these columns, in this order.
+-- InnoDB ignores words shorter than innodb_ft_min_token_size (default 3), so two-letter
+-- keywords such as "AI" need innodb_ft_min_token_size=2 in my.cnf, a server restart and
+-- a rebuild of this index before they can match.
+ALTER TABLE publication ADD FULLTEXT idx_pub_fulltext (title, abstract, keywords, venue);
+
+-- Join and filter indexes for the university keyword, faculty publication and person
+-- search queries, which join publication -> publication_author -> faculty and filter on
+-- faculty.university or faculty.name. Check with EXPLAIN that faculty and
+-- publication_author are read with "ref" access rather than "ALL".
+CREATE INDEX idx_faculty_university ON faculty (university);
+-- name LIKE '%...%' cannot seek on this index, but MySQL can scan the narrow index instead
+-- of the whole faculty table; prefix searches (LIKE 'name%') use it directly.
+CREATE INDEX idx_faculty_name ON faculty (name);
+-- Skip if the primary key of publication_author already starts with faculty_id.
+CREATE INDEX idx_publication_author_faculty ON publication_author (faculty_id, publication_id);
+-- Newest-first ordering of a faculty member's publications.
+CREATE INDEX idx_publication_year ON publication (year DESC);